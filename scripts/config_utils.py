@@ -8,6 +8,9 @@ from typing import Any, Dict, List
 
 import yaml
 
+# Use libyaml's C parser when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 ROOT = Path(__file__).resolve().parents[1]
 MKDOCS_PATH = ROOT / "mkdocs.yml"
 SYNC_CONFIG_PATH = Path(__file__).parent / "sync_config.yaml"
@@ -15,8 +18,8 @@ TRANSLATION_CONFIG_PATH = Path(__file__).parent / "translation_config.yaml"
 
 
 def load_mkdocs_config() -> Dict[str, Any]:
-    with MKDOCS_PATH.open("r", encoding="utf-8") as stream:
-        return yaml.safe_load(stream) or {}
+    with MKDOCS_PATH.open("rb") as stream:
+        return yaml.load(stream, Loader=YAML_SAFE_LOADER) or {}
 
 
 def get_i18n_languages(config: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
@@ -149,8 +152,8 @@ def load_sync_config() -> Dict[str, Any]:
     if not SYNC_CONFIG_PATH.exists():
         return {}
     
-    with SYNC_CONFIG_PATH.open("r", encoding="utf-8") as stream:
-        return yaml.safe_load(stream) or {}
+    with SYNC_CONFIG_PATH.open("rb") as stream:
+        return yaml.load(stream, Loader=YAML_SAFE_LOADER) or {}
 
 
 def get_remove_headers() -> List[str]:
@@ -179,8 +182,8 @@ def load_translation_config() -> Dict[str, Any]:
     if not TRANSLATION_CONFIG_PATH.exists():
         return {}
     
-    with TRANSLATION_CONFIG_PATH.open("r", encoding="utf-8") as stream:
-        return yaml.safe_load(stream) or {}
+    with TRANSLATION_CONFIG_PATH.open("rb") as stream:
+        return yaml.load(stream, Loader=YAML_SAFE_LOADER) or {}
 
 
 def load_metadata_config() -> Dict[str, Any]:
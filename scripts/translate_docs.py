@@ -6,33 +6,56 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import stat
+import threading
 import time
 from collections import defaultdict
+from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Iterator, List, Tuple
-import aiofiles
+from typing import Callable, Iterable, Iterator, List, Tuple
 
+import requests
 from deep_translator import GoogleTranslator
+from deep_translator import google as deep_translator_google
+from deep_translator.exceptions import TooManyRequests
 from tqdm.asyncio import tqdm
 
-from config_utils import get_i18n_languages, get_translation_locales, update_mkdocs_alternate_menu, update_menu_translations_json
+from config_utils import (
+    YAML_SAFE_LOADER,
+    get_i18n_languages,
+    get_translation_locales,
+    update_mkdocs_alternate_menu,
+    update_menu_translations_json,
+)
 import yaml
 
 ROOT = Path(__file__).resolve().parents[1]
 DOCS_ROOT = ROOT / "docs"
 TRANSLATION_CONFIG_PATH = ROOT / "scripts" / "translation_config.yaml"
+TRANSLATION_CACHE_PATH = ROOT / "scripts" / ".translate_cache.sqlite"
+TRANSLATION_MANIFEST_PATH = ROOT / "scripts" / ".translation_manifest.json"
 
 LANGUAGE_METADATA = get_i18n_languages()
 TRANSLATION_LOCALES = get_translation_locales()
 
 # For folder structure, we don't use suffixes
 TRANSLATION_SUFFIXES = {locale: f".{locale}.md" for locale in TRANSLATION_LOCALES}
+TRANSLATION_SUFFIX_TUPLE = tuple(TRANSLATION_SUFFIXES.values())
 
-IGNORED_NAMES = {".gitignore", ".pages"}
+IGNORED_NAMES = frozenset({".gitignore", ".pages"})
 # Add language folders to ignored directories
-IGNORED_DIRS = {".git", "__pycache__", "assets"} | set(TRANSLATION_LOCALES)
+IGNORED_DIRS = frozenset({".git", "__pycache__", "assets"} | set(TRANSLATION_LOCALES))
 FENCE_PREFIX = "```"
+STYLE_OPEN_PREFIXES = ("<style>", "<style ")
 
 
 def load_translation_exclusions() -> dict:
@@ -41,19 +64,31 @@ def load_translation_exclusions() -> dict:
     return {}
 
 
+# Loaded once at import so concurrent workers never race to load it
+EXCLUSION_CONFIG = load_translation_exclusions()
+
+
 def get_exclusion_config():
-    """Get cached exclusion configuration."""
-    if not hasattr(get_exclusion_config, '_config'):
-        get_exclusion_config._config = load_translation_exclusions()
-    return get_exclusion_config._config
+    """Get the exclusion configuration loaded at import."""
+    return EXCLUSION_CONFIG
 
 
 def load_translation_config() -> dict:
-    """Load translation configuration from translation_config.yaml."""
+    """
+    Load translation configuration from translation_config.yaml.
+    
+    The parsed config is cached and only re-read when the file's
+    modification time changes.
+    """
     try:
-        with open(TRANSLATION_CONFIG_PATH, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        return config or {}
+        mtime = TRANSLATION_CONFIG_PATH.stat().st_mtime_ns
+        cached = getattr(load_translation_config, '_cache', None)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(TRANSLATION_CONFIG_PATH, 'rb') as f:
+            config = yaml.load(f, Loader=YAML_SAFE_LOADER) or {}
+        load_translation_config._cache = (mtime, config)
+        return config
     except (FileNotFoundError, yaml.YAMLError) as e:
         print(f"Warning: Could not load translation config: {e}")
         return {}
@@ -65,11 +100,13 @@ def load_metadata_config() -> dict:
     return config.get('metadata', {})
 
 
+# Loaded once at import so concurrent workers never race to load it
+METADATA_CONFIG = load_metadata_config()
+
+
 def get_metadata_config():
-    """Get cached metadata configuration."""
-    if not hasattr(get_metadata_config, '_config'):
-        get_metadata_config._config = load_metadata_config()
-    return get_metadata_config._config
+    """Get the metadata configuration loaded at import."""
+    return METADATA_CONFIG
 
 
 def get_metadata_for_file(file_path: Path, language: str = None) -> dict:
@@ -83,23 +120,35 @@ def get_metadata_for_file(file_path: Path, language: str = None) -> dict:
     Returns:
         Dictionary with 'title' and 'description' keys, or empty dict if not configured.
     """
-    metadata_config = get_metadata_config()
-    
-    if not metadata_config.get('enabled', False):
-        return {}
-    
     # Get relative path from docs root
-    try:
-        rel_path = file_path.relative_to(DOCS_ROOT)
-        file_key = str(rel_path).replace('\\', '/')
-    except ValueError:
+    file_key = get_file_key(file_path)
+    if file_key is None:
         # File is not in docs root
         return {}
     
+    metadata = lookup_metadata(file_key, language)
+    if metadata is None:
+        return {}
+    return {'title': metadata[0], 'description': metadata[1]}
+
+
+@functools.lru_cache(maxsize=4096)
+def lookup_metadata(file_key: str, language: str | None) -> tuple[str | None, str | None] | None:
+    """
+    Resolve (title, description) for a file key and language, memoized per pair.
+    
+    Returns None when nothing is configured, or when a language is requested
+    without an explicit translation (the default metadata is auto-translated then).
+    """
+    metadata_config = get_metadata_config()
+    
+    if not metadata_config.get('enabled', False):
+        return None
+    
     files_config = metadata_config.get('files', {})
     
     if file_key not in files_config:
-        return {}
+        return None
     
     file_metadata = files_config[file_key]
     
@@ -108,24 +157,18 @@ def get_metadata_for_file(file_path: Path, language: str = None) -> dict:
         lang_metadata = file_metadata.get('translations', {}).get(language, {})
         if lang_metadata:
             # Return explicit translation for this language
-            return {
-                'title': lang_metadata.get('title'),
-                'description': lang_metadata.get('description')
-            }
-        else:
-            # Language specified but no explicit translation - return empty dict
-            # This signals that default metadata should be auto-translated
-            return {}
+            return lang_metadata.get('title'), lang_metadata.get('description')
+        # Language specified but no explicit translation - return nothing
+        # This signals that default metadata should be auto-translated
+        return None
     
     # Return default metadata (for original files or when language is None)
-    return {
-        'title': file_metadata.get('title'),
-        'description': file_metadata.get('description')
-    }
+    return file_metadata.get('title'), file_metadata.get('description')
 
 
+@functools.lru_cache(maxsize=None)
 def get_file_key(file_path: Path) -> str | None:
-    """Get file key (relative path) for config lookup."""
+    """Get file key (relative path) for config lookup, memoized per path."""
     try:
         rel_path = file_path.relative_to(DOCS_ROOT)
         return str(rel_path).replace('\\', '/')
@@ -133,81 +176,59 @@ def get_file_key(file_path: Path) -> str | None:
         return None
 
 
-def get_table_config_for_file(file_path: Path) -> List[dict]:
-    """Get table translation configuration for a specific file."""
-    config = load_translation_config()
-    if not config:
-        return []
-    translation_config = config.get('translation', {})
-    if not translation_config:
-        return []
-    tables_config = translation_config.get('tables', {})
-    if not tables_config:
-        return []
-    files_config = tables_config.get('files', {})
-    if not files_config:
-        return []
+# Sections of the translation config that hold per-file settings under 'files'
+FILE_CONFIG_SECTIONS = ('tables', 'headers', 'texts')
+
+
+def get_file_config_index() -> dict[str, dict[str, List[dict]]]:
+    """
+    Get per-file configuration lists for each section, indexed by file key.
     
+    The index is built once per loaded translation config, so looking up a
+    file's settings is a single dict access instead of a chain of .get() calls.
+    """
+    config = load_translation_config()
+    cached = getattr(get_file_config_index, '_cache', None)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    
+    translation_config = config.get('translation') or {}
+    index = {}
+    for section in FILE_CONFIG_SECTIONS:
+        files_config = (translation_config.get(section) or {}).get('files') or {}
+        if not isinstance(files_config, dict):
+            files_config = {}
+        # Ignore entries that are not lists and filter out None values
+        index[section] = {
+            file_key: [cfg for cfg in result if cfg is not None]
+            for file_key, result in files_config.items()
+            if isinstance(result, list)
+        }
+    get_file_config_index._cache = (config, index)
+    return index
+
+
+def get_section_config_for_file(file_path: Path, section: str) -> List[dict]:
+    """Get the configuration list of a FILE_CONFIG_SECTIONS section for a specific file."""
     file_key = get_file_key(file_path)
-    if not file_key or file_key not in files_config:
+    if not file_key:
         return []
-    
-    result = files_config[file_key]
-    # Ensure result is a list and filter out None values
-    if not isinstance(result, list):
-        return []
-    return [cfg for cfg in result if cfg is not None]
+    return get_file_config_index()[section].get(file_key, [])
+
+
+def get_table_config_for_file(file_path: Path) -> List[dict]:
+    """Get table translation configuration for a specific file."""
+    return get_section_config_for_file(file_path, 'tables')
 
 
 def get_header_config_for_file(file_path: Path) -> List[dict]:
     """Get header translation configuration for a specific file."""
-    config = load_translation_config()
-    if not config:
-        return []
-    translation_config = config.get('translation', {})
-    if not translation_config:
-        return []
-    headers_config = translation_config.get('headers', {})
-    if not headers_config:
-        return []
-    files_config = headers_config.get('files', {})
-    if not files_config:
-        return []
-    
-    file_key = get_file_key(file_path)
-    if not file_key or file_key not in files_config:
-        return []
-    
-    result = files_config[file_key]
-    # Ensure result is a list and filter out None values
-    if not isinstance(result, list):
-        return []
-    return [cfg for cfg in result if cfg is not None]
+    return get_section_config_for_file(file_path, 'headers')
 
 
 def get_text_config_for_file(file_path: Path) -> List[dict]:
     """Get static text translation configuration for a specific file."""
-    config = load_translation_config()
-    if not config:
-        return []
-    translation_config = config.get('translation', {})
-    if not translation_config:
-        return []
-    texts_config = translation_config.get('texts', {})
-    if not texts_config:
-        return []
-    files_config = texts_config.get('files', {})
-    if not files_config:
-        return []
-
-    file_key = get_file_key(file_path)
-    if not file_key or file_key not in files_config:
-        return []
-
-    result = files_config[file_key]
-    if not isinstance(result, list):
-        return []
-    return [cfg for cfg in result if cfg is not None]
+    return get_section_config_for_file(file_path, 'texts')
 
 
 def get_retry_config() -> dict:
@@ -217,50 +238,502 @@ def get_retry_config() -> dict:
     retry_config = translation_config.get('retry', {})
     return {
         'max_attempts': retry_config.get('max_attempts', 3),
-        'delay_seconds': retry_config.get('delay_seconds', 2)
+        'delay_seconds': retry_config.get('delay_seconds', 2),
+        'backoff_factor': retry_config.get('backoff_factor', 2),
+        'max_delay_seconds': retry_config.get('max_delay_seconds', 30)
     }
 
 
-def retry_translate(translator: GoogleTranslator, text: str, context: str = "") -> str:
+TRANSLATION_CACHE_LOCK = threading.Lock()
+
+# Translations made or looked up during this run, keyed by (language, text), so
+# repeated strings (table cells, labels, headers) skip the cache database and
+# are reused even when the persistent cache is disabled
+TRANSLATION_MEMO: dict[tuple[str, str], str] = {}
+TRANSLATION_MEMO_SIZE = 8192
+TRANSLATION_MEMO_LOCK = threading.Lock()
+
+# Failed translations of the file currently being translated; set per file so
+# the manifest never records output that fell back to untranslated text
+TRANSLATION_FAILURES: contextvars.ContextVar[List[str] | None] = contextvars.ContextVar(
+    "translation_failures", default=None
+)
+
+
+class TranslationCache:
     """
-    Translate text with retry logic on failure.
+    Persistent content-addressed cache of translated strings.
+    
+    Entries are keyed by a 128-bit BLAKE2b hash of the target language and
+    source text, so identical snippets shared across files and runs are only
+    sent to the translator once. Writes are committed in batches.
+    """
+    
+    COMMIT_EVERY = 50
+    LOOKUP_CHUNK = 500  # Stay below SQLite's limit on bound parameters
+    
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(language: str, text: str) -> bytes:
+        return hashlib.blake2b(f"{language}\0{text}".encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, language: str, text: str) -> str | None:
+        key = self.make_key(language, text)
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def get_many(self, language: str, texts: Iterable[str]) -> dict[str, str]:
+        """Look up several texts at once; returns {text: translation} for the hits."""
+        keys = {self.make_key(language, text): text for text in texts}
+        key_list = list(keys)
+        found = {}
+        with self._lock:
+            for i in range(0, len(key_list), self.LOOKUP_CHUNK):
+                chunk = key_list[i:i + self.LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, value FROM cache WHERE key IN ({placeholders})", chunk)
+                for key, value in rows:
+                    found[keys[key]] = value
+        return found
+    
+    def set(self, language: str, text: str, value: str) -> None:
+        key = self.make_key(language, text)
+        with self._lock:
+            try:
+                self._conn.execute("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", (key, value))
+                self._pending += 1
+                if self._pending >= self.COMMIT_EVERY:
+                    self._conn.commit()
+                    self._pending = 0
+            except sqlite3.Error as e:
+                print(f"Warning: Could not write translation cache: {e}")
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+def get_translation_cache() -> TranslationCache | None:
+    """Get the shared translation cache, or None if caching is disabled."""
+    if not USE_TRANSLATION_CACHE:
+        return None
+    # Translations run in worker threads, so guard creation to share one connection
+    with TRANSLATION_CACHE_LOCK:
+        if not hasattr(get_translation_cache, '_cache'):
+            try:
+                get_translation_cache._cache = TranslationCache(TRANSLATION_CACHE_PATH)
+            except sqlite3.Error as e:
+                print(f"Warning: Could not open translation cache: {e}")
+                get_translation_cache._cache = None
+    return get_translation_cache._cache
+
+
+class TranslationManifest:
+    """
+    Source hashes of the translations written by previous runs.
+    
+    A (file, language) pair is up to date when the hash of its source and of
+    the translation config matches the recorded one and the output file still
+    exists, so unchanged files are not translated again.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._dirty = False
+        try:
+            self._entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._entries = {}
+        try:
+            config_bytes = TRANSLATION_CONFIG_PATH.read_bytes()
+        except OSError:
+            config_bytes = b""
+        self._config_digest = hashlib.sha256(config_bytes).digest()
+    
+    def source_hash(self, front_matter: str | None, body: str) -> str:
+        digest = hashlib.sha256(self._config_digest)
+        digest.update(f"{front_matter or ''}\0{body}".encode("utf-8"))
+        return digest.hexdigest()
+    
+    @staticmethod
+    def entry_key(path: Path, lang: str) -> str:
+        return f"{lang}/{get_file_key(path) or path.as_posix()}"
+    
+    def is_current(self, path: Path, lang: str, source_hash: str, output_path: Path) -> bool:
+        if self._entries.get(self.entry_key(path, lang)) != source_hash:
+            return False
+        return output_path.exists()
+    
+    def record(self, path: Path, lang: str, source_hash: str) -> None:
+        self._entries[self.entry_key(path, lang)] = source_hash
+        self._dirty = True
+    
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            # Write to a temporary file and swap it in, so an interrupted run
+            # never leaves a truncated manifest behind
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(self._entries, indent=0, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write translation manifest: {e}")
+
+
+def get_translation_manifest() -> TranslationManifest:
+    """Get the shared translation manifest, loading it on first use."""
+    if not hasattr(get_translation_manifest, '_manifest'):
+        get_translation_manifest._manifest = TranslationManifest(TRANSLATION_MANIFEST_PATH)
+    return get_translation_manifest._manifest
+
+
+def save_translation_manifest() -> None:
+    """Write the translation manifest if it was loaded and changed."""
+    manifest = getattr(get_translation_manifest, '_manifest', None)
+    if manifest is not None:
+        manifest.save()
+        del get_translation_manifest._manifest
+
+
+def pending_languages(path: Path, targets: Iterable[str], source_hash: str) -> dict[str, Path]:
+    """
+    Find the target languages whose translation of path is missing or out of date.
+    
+    Returns:
+        Output path of the translation for each of those languages, in target order
+    """
+    manifest = get_translation_manifest()
+    pending = {}
+    for lang in targets:
+        output_path = build_translation_path(path, TRANSLATION_SUFFIXES.get(lang, f".{lang}.md"))
+        if FORCE_TRANSLATION or not manifest.is_current(path, lang, source_hash, output_path):
+            pending[lang] = output_path
+    return pending
+
+
+def memoize_translation(language: str, text: str, translation: str) -> None:
+    """Keep a translation in memory for the rest of the run."""
+    with TRANSLATION_MEMO_LOCK:
+        if len(TRANSLATION_MEMO) >= TRANSLATION_MEMO_SIZE:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del TRANSLATION_MEMO[next(iter(TRANSLATION_MEMO))]
+        TRANSLATION_MEMO[(language, text)] = translation
+
+
+def recall_translation(language: str, text: str) -> str | None:
+    """Look up a translation made earlier in this run, then in the persistent cache."""
+    translation = TRANSLATION_MEMO.get((language, text))
+    if translation is None:
+        cache = get_translation_cache()
+        if cache is not None:
+            translation = cache.get(language, text)
+            if translation is not None:
+                memoize_translation(language, text, translation)
+    return translation
+
+
+def remember_translation(language: str, text: str, translation: str) -> None:
+    """Store a new translation in memory and in the persistent cache."""
+    memoize_translation(language, text, translation)
+    cache = get_translation_cache()
+    if cache is not None:
+        cache.set(language, text, translation)
+
+
+def lookup_cached_translations(translator: GoogleTranslator, texts: Iterable[str]) -> dict[str, str]:
+    """Fetch known translations of texts for the translator's target language in one query."""
+    language = getattr(translator, '_target', None)
+    if not language:
+        return {}
+    found = {}
+    remaining = []
+    for text in texts:
+        translation = TRANSLATION_MEMO.get((language, text))
+        if translation is None:
+            remaining.append(text)
+        else:
+            found[text] = translation
+    cache = get_translation_cache()
+    if cache is not None and remaining:
+        found.update(cache.get_many(language, remaining))
+    return found
+
+
+def close_translation_cache() -> None:
+    """Flush pending cache writes and close the cache database."""
+    with TRANSLATION_CACHE_LOCK:
+        cache = getattr(get_translation_cache, '_cache', None)
+        if cache is not None:
+            cache.close()
+        if hasattr(get_translation_cache, '_cache'):
+            del get_translation_cache._cache
+
+
+class PooledHttp:
+    """
+    Stand-in for the ``requests`` module used by deep_translator's Google backend.
+
+    deep_translator calls ``requests.get`` directly, which opens a fresh TCP/TLS
+    connection for every request. This routes those calls through keep-alive
+    sessions instead. Sessions are not guaranteed to be thread-safe, so each
+    worker thread gets its own.
+    """
+
+    def __init__(self, pool_size: int = 10):
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_size,
+                                                    pool_maxsize=self.pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def get(self, *args, **kwargs):
+        return self.session().get(*args, **kwargs)
+
+    def close(self) -> None:
+        """Close every session opened so far."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        # Anything else (exceptions, status codes, ...) comes from requests itself
+        return getattr(requests, name)
+
+
+HTTP_POOL = PooledHttp()
+
+
+def use_pooled_http() -> None:
+    """Make deep_translator's Google backend send its requests through HTTP_POOL."""
+    if hasattr(deep_translator_google, 'requests'):
+        deep_translator_google.requests = HTTP_POOL
+
+
+class SharedTranslator:
+    """
+    GoogleTranslator for one target language, shared across files and threads.
+    
+    GoogleTranslator.translate stores the request parameters on the instance,
+    so an instance must never be used by two threads at once. Each worker
+    thread gets its own instance, created on first use and then reused.
+    """
+    
+    def __init__(self, target: str):
+        self._local = threading.local()
+        self._requested_target = target
+        # Building the first instance validates the language code up front
+        self._target = self.translator._target
+    
+    @property
+    def translator(self) -> GoogleTranslator:
+        """The calling thread's GoogleTranslator."""
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            translator = GoogleTranslator(source="auto", target=self._requested_target)
+            self._local.translator = translator
+        return translator
+    
+    def translate(self, text: str, **kwargs) -> str:
+        return self.translator.translate(text, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def get_translator(lang: str) -> SharedTranslator:
+    """Get the translator for a target language, created once per run."""
+    return SharedTranslator(lang)
+
+
+def request_translation(translator: GoogleTranslator, text: str, context: str = "",
+                        on_error: Callable[[Exception], None] | None = None) -> str | None:
+    """
+    Send text to the translator, retrying with backoff on failure.
+    
+    Unlike retry_translate this neither consults nor fills the caches and does
+    not record failures, so callers decide what a result or a failure means.
     
     Args:
         translator: GoogleTranslator instance
         text: Text to translate
         context: Optional context string for error messages
+        on_error: Optional callback invoked with the exception of each failed attempt
     
     Returns:
-        Translated text, or original text if all attempts fail
+        Translated text, or None if all attempts fail
     """
     retry_config = get_retry_config()
     max_attempts = retry_config['max_attempts']
     delay_seconds = retry_config['delay_seconds']
+    backoff_factor = retry_config['backoff_factor']
+    max_delay_seconds = retry_config['max_delay_seconds']
     
-    last_exception = None
     for attempt in range(1, max_attempts + 1):
         try:
             result = translator.translate(text)
             if result is not None:
                 return result
         except Exception as e:
-            last_exception = e
+            if on_error is not None:
+                on_error(e)
             if attempt < max_attempts:
                 context_msg = f" ({context})" if context else ""
                 print(f"Warning: Translation attempt {attempt}/{max_attempts} failed{context_msg}: {e}")
-                print(f"Retrying in {delay_seconds} seconds...")
-                time.sleep(delay_seconds)
+                # Back off exponentially, with jitter so concurrent workers don't retry in lockstep
+                delay = min(delay_seconds * backoff_factor ** (attempt - 1), max_delay_seconds)
+                delay *= random.uniform(1.0, 1.25)
+                print(f"Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
             else:
                 context_msg = f" ({context})" if context else ""
                 print(f"Warning: Translation failed after {max_attempts} attempts{context_msg}: {e}")
+    return None
+
+
+def retry_translate(translator: GoogleTranslator, text: str, context: str = "",
+                    on_error: Callable[[Exception], None] | None = None) -> str:
+    """
+    Translate text with retry logic on failure.
+    
+    Args:
+        translator: GoogleTranslator instance
+        text: Text to translate
+        context: Optional context string for error messages
+        on_error: Optional callback invoked with the exception of each failed attempt
     
-    # If all attempts failed, return original text
-    return text
+    Returns:
+        Translated text, or original text if all attempts fail
+    """
+    # Blank text has nothing to translate, so skip the request and the retries
+    if not text.strip():
+        return text
+    
+    language = getattr(translator, '_target', None)
+    if language:
+        cached = recall_translation(language, text)
+        if cached is not None:
+            return cached
+    
+    result = request_translation(translator, text, context, on_error)
+    if result is None:
+        # If all attempts failed, return original text
+        failures = TRANSLATION_FAILURES.get()
+        if failures is not None:
+            failures.append(context)
+        return text
+    if language:
+        remember_translation(language, text, result)
+    return result
+
+
+class AdmissionController:
+    """
+    Limit concurrent translations with a cap that adapts to rate limiting.
+    
+    Works like a semaphore (``async with controller:``), but the cap shrinks by
+    one whenever the translator reports HTTP 429 and grows back by one after a
+    streak of successful translations, up to the initial maximum. Admissions are
+    also spaced at least min_interval seconds apart, so requests are paced by
+    rate rather than by sleeping after each one.
+    """
+    
+    def __init__(self, max_concurrent: int, min_concurrent: int = 1, grow_after: int = 20,
+                 min_interval: float = 0.0):
+        self._active = 0
+        self._limit = max(max_concurrent, 1)
+        self._ceiling = self._limit
+        self._floor = min(max(min_concurrent, 1), self._limit)
+        self._grow_after = grow_after
+        self._successes = 0
+        self._min_interval = max(min_interval, 0.0)
+        self._next_start = 0.0
+        self._cond = asyncio.Condition()
+    
+    @property
+    def limit(self) -> int:
+        return self._limit
+    
+    async def acquire(self) -> None:
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+        if self._min_interval:
+            # Reserve the next start time; the event loop runs one coroutine at a
+            # time, so no lock is needed between reading and updating it
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._min_interval
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    # __aexit__ never runs when acquire fails, so give the slot back here
+                    await self.release()
+                    raise
+    
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+    
+    async def shrink(self) -> None:
+        """Lower the cap after a rate-limit response."""
+        async with self._cond:
+            self._successes = 0
+            if self._limit > self._floor:
+                self._limit -= 1
+    
+    async def record_success(self) -> None:
+        """Count a successful translation and raise the cap after a streak."""
+        async with self._cond:
+            self._successes += 1
+            if self._successes >= self._grow_after and self._limit < self._ceiling:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+    
+    async def __aenter__(self) -> AdmissionController:
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
 
 # Async configuration
 MAX_CONCURRENT_TRANSLATIONS = 10  # Increased for parallel language translation
 MAX_CONCURRENT_FILES = 2  # Reduced since each file now processes multiple languages in parallel
-TRANSLATION_DELAY = 0.05  # Reduced delay since we have better concurrency control
+TRANSLATION_DELAY = 0.05  # Minimum seconds between the starts of two translate requests
+USE_TRANSLATION_CACHE = True  # Reuse translations stored in TRANSLATION_CACHE_PATH
+FORCE_TRANSLATION = False  # Translate files even if TRANSLATION_MANIFEST_PATH says they are up to date
+PROGRESS_DESCRIPTION_INTERVAL = 1.0  # Minimum seconds between progress bar description updates
+TABLE_ROW_BATCH_SIZE = 20  # Table rows sent to the translator in a single request
+TRANSLATE_BATCH_MAX_CHARS = 4500  # Keep batched requests below the translator's 5000 character limit
 
 # Protected terms that should not be translated
 PROTECTED_TERMS = [
@@ -274,6 +747,17 @@ PROTECTED_TERMS = [
     "Connector"
 ]
 
+# Any protected term, for checking whether a text mentions one in a single scan
+PROTECTED_TERMS_RE = re.compile("|".join(re.escape(term) for term in PROTECTED_TERMS))
+
+# Placeholders produced by protect_terms: __PROTECTED_<KIND>_<n>__
+# (any upper-case kind, so new placeholder kinds are restored without touching this)
+PLACEHOLDER_PATTERN = re.compile(r'__PROTECTED_[A-Z_]+_\d+__')
+
+# Excluded table columns: __EXCLUDE_COL_<number>__<content>__EXCLUDE_COL_<same number>__
+# (non-greedy, so the shortest possible content is matched)
+EXCLUDE_COL_PATTERN = re.compile(r'__EXCLUDE_COL_(\d+)__(.*?)__EXCLUDE_COL_\1__')
+
 # CSS classes and HTML attributes that should not be translated
 PROTECTED_CSS_CLASSES = [
     "release-info",
@@ -284,31 +768,79 @@ PROTECTED_CSS_CLASSES = [
     "apple"
 ]
 
+# Opening tags whose text content is translated in HTML lines. These are
+# prefixes, so longer tags such as <pre>, <aside> or <article> match as well
+HTML_TEXT_TAG_PATTERN = re.compile(r'<(p|h[1-6]|span|div|a)')
+
+# Text content between an opening and a closing HTML tag
+HTML_TEXT_CONTENT_PATTERN = re.compile(r'>([^<]+)<')
+
+# Deletes the characters of a table separator row (|---|:--:|), so a separator
+# row translates to an empty string
+SEPARATOR_CHARS_TABLE = str.maketrans('', '', '-:| ')
+
+# Exclusion settings flattened once for the per-line checks in segment_markdown
+EXCLUDED_HTML_ELEMENTS = frozenset(EXCLUSION_CONFIG.get('html_elements') or ())
+EXCLUDED_TEXT_PATTERNS = tuple(EXCLUSION_CONFIG.get('text_patterns') or ())
+EXCLUDED_TEXT_PATTERN_RE = (
+    re.compile("|".join(re.escape(pattern) for pattern in EXCLUDED_TEXT_PATTERNS))
+    if EXCLUDED_TEXT_PATTERNS else None
+)
+
+
+def get_protected_terms_pattern() -> tuple[re.Pattern, dict]:
+    """
+    Get cached tokenizer pattern and placeholder lookup for protected text.
+    
+    The pattern matches, in order of precedence, excluded table columns
+    (group ``exclude_col``), backtick spans (group ``backtick``) and
+    PROTECTED_TERMS plus the CSS classes and text patterns from the exclusion
+    config, so protect_terms can replace all of them in one scan.
+    The cache is rebuilt whenever get_exclusion_config() returns a new object.
+    """
+    exclusion_config = get_exclusion_config()
+    cached = getattr(get_protected_terms_pattern, '_cache', None)
+    if cached is not None and cached[0] is exclusion_config:
+        return cached[1], cached[2]
+    
+    placeholders = {}
+    groups = (
+        ("TERM", PROTECTED_TERMS),
+        ("CSS", exclusion_config.get('css_classes') or []),
+        ("PATTERN", exclusion_config.get('text_patterns') or []),
+    )
+    for prefix, terms in groups:
+        for i, term in enumerate(terms):
+            # A term listed in several groups keeps its first placeholder
+            if term and term not in placeholders:
+                placeholders[term] = f"__PROTECTED_{prefix}_{i}__"
+    
+    alternatives = [
+        r'(?P<exclude_col>__EXCLUDE_COL_(?P<column>\d+)__.*?__EXCLUDE_COL_(?P=column)__)',
+        r'`(?P<backtick>[^`]*)`',
+    ]
+    # Alternation is ordered, so try longer terms first: a term that contains
+    # another one (e.g. "Angry Data Scanner" and "Angry Data") is kept whole
+    alternatives.extend(re.escape(term) for term in sorted(placeholders, key=len, reverse=True))
+    pattern = re.compile("|".join(alternatives))
+    get_protected_terms_pattern._cache = (exclusion_config, pattern, placeholders)
+    return pattern, placeholders
+
 
 def iter_markdown_files(root: Path) -> Iterator[Path]:
     """Iterate over markdown files in the root directory, excluding translations."""
-    for path in root.rglob("*.md"):
-        # Skip files with translation suffixes (legacy)
-        if any(path.name.endswith(suffix) for suffix in TRANSLATION_SUFFIXES.values()):
-            continue
-        if path.name in IGNORED_NAMES:
-            continue
-        # Skip files in ignored directories (including language folders)
-        if any(part in IGNORED_DIRS for part in path.parts):
-            continue
-        # Only process files directly in docs root or its subdirectories (not in language folders)
-        try:
-            rel_path = path.relative_to(root)
-            # Check if the first directory component is a language code
-            if len(rel_path.parts) > 1 and rel_path.parts[0] in TRANSLATION_LOCALES:
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune ignored directories (including language folders) so they are never scanned
+        dirnames[:] = sorted(d for d in dirnames if d not in IGNORED_DIRS)
+        for name in sorted(filenames):
+            # Skip files with translation suffixes (legacy)
+            if not name.endswith(".md") or name.endswith(TRANSLATION_SUFFIX_TUPLE) or name in IGNORED_NAMES:
                 continue
-        except ValueError:
-            continue
-        yield path
+            yield Path(dirpath, name)
 
 
 def split_front_matter(content: str) -> tuple[str | None, str]:
-    if content.startswith("---\n"):
+    if len(content) > 4 and content[:4] == "---\n":
         end = content.find("\n---", 4)
         if end != -1:
             end += len("\n---")
@@ -316,6 +848,120 @@ def split_front_matter(content: str) -> tuple[str | None, str]:
     return None, content
 
 
+def compose_output(front_matter: str | None, body: str) -> str:
+    """
+    Join front matter and body into file content.
+    
+    Same result as stripping "front_matter + blank line + body" and adding a
+    final newline, but the content is assembled in a single join.
+    """
+    front_matter = front_matter.lstrip() if front_matter else ""
+    body = body.rstrip()
+    if not front_matter:
+        return body.lstrip() + "\n"
+    if not body:
+        return front_matter.rstrip() + "\n"
+    return "".join((front_matter, "\n\n", body, "\n"))
+
+
+def translate_fields(translator: GoogleTranslator, values: List[str], context: str = "",
+                     on_error: Callable[[Exception], None] | None = None, separator: str = '\n') -> List[str]:
+    """
+    Translate several short strings with one request.
+    
+    The values are joined with separator (a newline by default, or a blank line
+    for multi-line paragraphs), which the translator keeps, and the result is
+    split again. If a value contains the separator or the number of parts
+    changes, each value is translated on its own instead. Each translated value
+    is cached on its own (the joined request never is), so it is found again
+    however it is batched. If the request fails, each half of the values is
+    retried separately, so a value that never translates only keeps itself
+    untranslated.
+    
+    Args:
+        translator: GoogleTranslator instance
+        values: Strings to translate
+        context: Optional context string for error messages
+        on_error: Optional callback invoked with the exception of each failed attempt
+        separator: String placed between the values
+    
+    Returns:
+        Translated strings in the same order as values
+    """
+    if len(values) > 1 and not any(separator in value for value in values):
+        joined = separator.join(values)
+        if not joined.strip():
+            return list(values)
+        result = request_translation(translator, joined, context, on_error)
+        if result is None:
+            middle = len(values) // 2
+            return (translate_fields(translator, values[:middle], context, on_error, separator)
+                    + translate_fields(translator, values[middle:], context, on_error, separator))
+        translated = result.split(separator)
+        if len(translated) == len(values):
+            translated = [value.strip() for value in translated]
+            language = getattr(translator, '_target', None)
+            if language:
+                for value, translation in zip(values, translated):
+                    remember_translation(language, value, translation)
+            return translated
+    return [retry_translate(translator, value, context, on_error) for value in values]
+
+
+def resolve_metadata_fields(metadata: dict, lang_metadata: dict, translator: GoogleTranslator = None,
+                            keys: Iterable[str] = ('title', 'description'),
+                            on_error: Callable[[Exception], None] | None = None) -> dict:
+    """
+    Resolve the title/description values to write for a language.
+    
+    Language-specific values are used as-is. Default values are machine
+    translated when a translator is given, all in a single request; on_error
+    is passed on to translate_fields.
+    
+    Returns:
+        Dictionary with the resolved value of each key that has one
+    """
+    resolved = {}
+    to_translate = []
+    for key in keys:
+        if lang_metadata and lang_metadata.get(key):
+            resolved[key] = lang_metadata[key]
+        elif metadata.get(key):
+            resolved[key] = metadata[key]
+            # Translate if no language-specific version
+            if translator:
+                to_translate.append(key)
+    
+    if to_translate:
+        translated = translate_fields(translator, [resolved[key] for key in to_translate], "metadata", on_error)
+        resolved.update(zip(to_translate, translated))
+    return resolved
+
+
+def build_metadata_front_matter(metadata: dict, lang_metadata: dict, translator: GoogleTranslator = None,
+                                on_error: Callable[[Exception], None] | None = None) -> str | None:
+    """
+    Build front matter from the metadata config for a file that has none.
+    
+    on_error is invoked with the exception of each failed translation attempt.
+    
+    Returns:
+        The front matter block, or None if metadata has no title or description
+    """
+    if not (metadata.get('title') or metadata.get('description')):
+        return None
+    # Language-specific metadata is used as-is; defaults are translated
+    resolved = resolve_metadata_fields(metadata, lang_metadata, translator, on_error=on_error)
+    
+    front_matter_lines = ["---"]
+    if resolved.get('title'):
+        front_matter_lines.append(f"title: {resolved['title']}")
+    if resolved.get('description'):
+        front_matter_lines.append(f"description: {resolved['description']}")
+    front_matter_lines.append("---")
+    return "\n".join(front_matter_lines)
+
+
 def add_metadata_to_front_matter(front_matter: str, metadata: dict, lang: str = None, 
                                  translator: GoogleTranslator = None, file_path: Path = None) -> str:
     """
@@ -346,107 +992,48 @@ def add_metadata_to_front_matter(front_matter: str, metadata: dict, lang: str =
     if lang and file_path:
         lang_metadata = get_metadata_for_file(file_path, lang)
     
-    # Parse front matter lines
-    lines = front_matter.split('\n')
-    new_lines = []
-    title_added = has_title
-    description_added = has_description
+    # Resolve the missing fields up front so they are translated in one request
+    missing_keys = [key for key, present in (('title', has_title), ('description', has_description)) if not present]
+    resolved = resolve_metadata_fields(metadata, lang_metadata, translator, missing_keys)
     
-    # Find where to insert (after first ---, before last ---)
-    first_dash_idx = -1
-    last_dash_idx = -1
+    title = None if has_title else resolved.get('title')
+    description = None if has_description else resolved.get('description')
+    if not title and not description:
+        return front_matter
     
-    for i, line in enumerate(lines):
-        if line.strip() == '---':
-            if first_dash_idx == -1:
-                first_dash_idx = i
-            last_dash_idx = i
+    # Find the opening and closing --- in one sweep
+    lines = front_matter.split('\n')
+    dash_indices = [i for i, line in enumerate(lines) if line.strip() == '---']
+    if not dash_indices:
+        return front_matter
     
-    # Build new front matter
-    for i, line in enumerate(lines):
-        new_lines.append(line)
-        
-        # Add title after first --- if not present
-        if i == first_dash_idx and not title_added:
-            title = None
-            if lang_metadata and lang_metadata.get('title'):
-                title = lang_metadata['title']
-            elif metadata.get('title'):
-                title = metadata['title']
-                # Translate if no language-specific version
-                if translator and (not lang_metadata or not lang_metadata.get('title')):
-                    title = retry_translate(translator, title, "metadata title")
-            
-            if title:
-                new_lines.append(f"title: {title}")
-                title_added = True
-        
-        # Add description after title (or after first --- if no title)
-        if (line.strip().startswith('title:') or (i == first_dash_idx and title_added)) and not description_added:
-            description = None
-            if lang_metadata and lang_metadata.get('description'):
-                description = lang_metadata['description']
-            elif metadata.get('description'):
-                description = metadata['description']
-                # Translate if no language-specific version
-                if translator and (not lang_metadata or not lang_metadata.get('description')):
-                    description = retry_translate(translator, description, "metadata description")
-            
-            if description:
-                # Insert after current line (title) or after first ---
-                insert_idx = len(new_lines)
-                new_lines.insert(insert_idx, f"description: {description}")
-                description_added = True
-    
-    # If still not added, add before last ---
-    if not title_added and metadata.get('title'):
-        title = None
-        if lang_metadata and lang_metadata.get('title'):
-            title = lang_metadata['title']
-        elif metadata.get('title'):
-            title = metadata['title']
-            if translator and (not lang_metadata or not lang_metadata.get('title')):
-                title = retry_translate(translator, title, "metadata title")
-        
-        if title and last_dash_idx >= 0:
-            new_lines.insert(last_dash_idx, f"title: {title}")
-            title_added = True
-    
-    if not description_added and metadata.get('description'):
-        description = None
-        if lang_metadata and lang_metadata.get('description'):
-            description = lang_metadata['description']
-        elif metadata.get('description'):
-            description = metadata['description']
-            if translator and (not lang_metadata or not lang_metadata.get('description')):
-                description = retry_translate(translator, description, "metadata description")
-        
-        if description and last_dash_idx >= 0:
-            # Find title to insert after it, or insert before last ---
-            title_idx = -1
-            for i, line in enumerate(new_lines):
-                if line.strip().startswith('title:'):
-                    title_idx = i
-                    break
-            
-            if title_idx >= 0:
-                new_lines.insert(title_idx + 1, f"description: {description}")
-            else:
-                new_lines.insert(last_dash_idx, f"description: {description}")
+    if title or has_title:
+        # Title goes right after the opening ---, description right after the title
+        insert_idx = dash_indices[0] + 1
+        new_lines = [f"{key}: {value}" for key, value in (('title', title), ('description', description)) if value]
+    else:
+        # No title at all: description goes before the closing ---
+        insert_idx = dash_indices[-1]
+        new_lines = [f"description: {description}"]
     
-    return '\n'.join(new_lines)
+    return '\n'.join(lines[:insert_idx] + new_lines + lines[insert_idx:])
 
 
 def translate_front_matter(front_matter: str, translator: GoogleTranslator, 
-                          file_path: Path = None, target_lang: str = None) -> str:
+                          file_path: Path = None, target_lang: str = None,
+                          on_error: Callable[[Exception], None] | None = None) -> str:
     """
     Translate title and description in front matter YAML.
     
+    Fields missing from the front matter are filled in from the file's default
+    metadata, so the block is parsed and dumped only once per language.
+    
     Args:
         front_matter: The front matter YAML content
         translator: GoogleTranslator instance for translation
-        file_path: Path to the source file (for metadata override lookup)
+        file_path: Path to the source file (for metadata and override lookup)
         target_lang: Target language code (for metadata override lookup)
+        on_error: Optional callback invoked with the exception of each failed attempt
     
     Returns:
         Translated front matter YAML content
@@ -454,151 +1041,118 @@ def translate_front_matter(front_matter: str, translator: GoogleTranslator,
     if not front_matter:
         return front_matter
     
-    import re
+    # Strip the --- fences and parse the YAML once
+    inner = front_matter.strip()
+    if inner.startswith('---'):
+        inner = inner[3:]
+    if inner.endswith('---'):
+        inner = inner[:-3]
+    try:
+        data = yaml.load(inner, Loader=YAML_SAFE_LOADER)
+    except yaml.YAMLError:
+        return front_matter
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return front_matter
     
-    # Get metadata overrides if available
+    # Get default metadata and overrides if available
+    metadata = {}
     metadata_overrides = {}
-    if file_path and target_lang:
-        metadata_overrides = get_metadata_for_file(file_path, target_lang)
+    if file_path:
+        metadata = get_metadata_for_file(file_path, None)
+        if target_lang:
+            metadata_overrides = get_metadata_for_file(file_path, target_lang)
+    
+    # Missing fields are taken from the default metadata and go first,
+    # like add_metadata_to_front_matter inserts them after the opening ---
+    added = {
+        key: metadata[key] for key in ('title', 'description')
+        if data.get(key) is None and metadata.get(key)
+    }
+    if added:
+        data = {**added, **{key: value for key, value in data.items() if key not in added}}
+    elif not ('title' in data or 'description' in data):
+        return front_matter
     
-    # Parse YAML-like content to find title and description
-    lines = front_matter.split('\n')
-    translated_lines = []
-    
-    for line in lines:
-        # Check if this line contains title or description
-        if line.strip().startswith('title:') or line.strip().startswith('description:'):
-            # Extract the key and value
-            match = re.match(r'^(\s*)(title|description):\s*(.+)$', line)
-            if match:
-                indent = match.group(1)
-                key = match.group(2)
-                value = match.group(3).strip()
-                
-                # Check if we have an override for this field
-                override_value = metadata_overrides.get(key)
-                
-                if override_value:
-                    # Use the override value directly (no translation needed)
-                    translated_value = override_value
-                else:
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    
-                    # Protect terms before translation
-                    protected_value, protected_mapping = protect_terms(value)
-                    translated_value = retry_translate(translator, protected_value, f"front matter {key}")
-                    # Restore protected terms after translation
-                    translated_value = restore_terms(translated_value, protected_mapping)
-                
-                # Re-add quotes if the original had them
-                if (match.group(3).strip().startswith('"') and match.group(3).strip().endswith('"')) or \
-                   (match.group(3).strip().startswith("'") and match.group(3).strip().endswith("'")):
-                    translated_value = f'"{translated_value}"'
-                
-                translated_line = f"{indent}{key}: {translated_value}"
-                translated_lines.append(translated_line)
-            else:
-                translated_lines.append(line)
+    pending_keys = []
+    for key in ('title', 'description'):
+        if data.get(key) is None:
+            continue
+        
+        # Check if we have an override for this field
+        override_value = metadata_overrides.get(key)
+        
+        if override_value:
+            # Use the override value directly (no translation needed)
+            data[key] = override_value
         else:
-            translated_lines.append(line)
+            pending_keys.append(key)
     
-    return '\n'.join(translated_lines)
-
-
-def protect_backticks(text: str) -> tuple[str, dict]:
-    """Replace content in backticks with placeholders and return mapping."""
-    import re
-    protected_mapping = {}
-    protected_text = text
-    
-    # Find all content in backticks (but not code blocks)
-    pattern = r'`([^`]*)`'
-    matches = re.finditer(pattern, protected_text)
-    
-    for i, match in enumerate(matches):
-        backtick_content = match.group(1)
-        if backtick_content.strip():  # Only protect non-empty content
-            placeholder = f"__PROTECTED_BACKTICK_{i}__"
-            protected_mapping[placeholder] = f"`{backtick_content}`"
-            protected_text = protected_text.replace(f"`{backtick_content}`", placeholder)
+    if pending_keys:
+        # Protect terms before translation and send all fields in one request
+        protected = [protect_terms(str(data[key])) for key in pending_keys]
+        translated = translate_fields(translator, [text for text, _ in protected], "front matter", on_error)
+        # Restore protected terms after translation
+        for key, value, (_, protected_mapping) in zip(pending_keys, translated, protected):
+            data[key] = restore_terms(value, protected_mapping)
     
-    return protected_text, protected_mapping
+    return "---\n" + yaml.safe_dump(data, allow_unicode=True, sort_keys=False, width=float("inf")) + "---"
 
 
 def protect_terms(text: str) -> tuple[str, dict]:
-    """Replace protected terms with placeholders and return mapping."""
-    protected_mapping = {}
-    protected_text = text
+    """
+    Replace protected text with placeholders and return mapping.
     
-    # Get exclusion configuration
-    exclusion_config = get_exclusion_config()
+    Excluded table columns, non-empty backtick spans and protected terms are
+    replaced in a single left-to-right scan; where matches overlap the one
+    starting first wins, so terms inside backticks stay part of the span.
+    """
+    protected_mapping = {}
+    backtick_placeholders = {}
+    exclude_col_count = 0
+    backtick_count = 0
+    pattern, placeholders = get_protected_terms_pattern()
+    
+    def replace_token(match: re.Match) -> str:
+        nonlocal exclude_col_count, backtick_count
+        token = match.group(0)
+        if match.group('exclude_col') is not None:
+            # Pattern: __EXCLUDE_COL_<number>__<content>__EXCLUDE_COL_<same number>__
+            placeholder = f"__PROTECTED_EXCLUDE_COL_{exclude_col_count}__"
+            exclude_col_count += 1
+        elif match.group('backtick') is not None:
+            index = backtick_count
+            backtick_count += 1
+            if not match.group('backtick').strip():  # Only protect non-empty content
+                return token
+            # Repeated spans share the placeholder of their first occurrence
+            placeholder = backtick_placeholders.setdefault(token, f"__PROTECTED_BACKTICK_{index}__")
+        else:
+            placeholder = placeholders[token]
+        protected_mapping[placeholder] = token
+        return placeholder
     
-    # Protect excluded column placeholders first (before other protections)
-    import re
-    # Match placeholders - use non-greedy match to get the shortest possible match
-    # Pattern: __EXCLUDE_COL_<number>__<content>__EXCLUDE_COL_<same number>__
-    # We need to match the content between the markers, which should not contain the closing marker
-    exclude_col_pattern = r'__EXCLUDE_COL_(\d+)__(.*?)__EXCLUDE_COL_\1__'
-    exclude_col_matches = list(re.finditer(exclude_col_pattern, protected_text))
-    # Process matches in reverse order to preserve indices when replacing
-    for i, match in enumerate(reversed(exclude_col_matches)):
-        placeholder = f"__PROTECTED_EXCLUDE_COL_{len(exclude_col_matches) - 1 - i}__"
-        full_match = match.group(0)
-        protected_mapping[placeholder] = full_match
-        # Replace from end to start to preserve positions
-        start, end = match.span()
-        protected_text = protected_text[:start] + placeholder + protected_text[end:]
-    
-    # Protect content in backticks
-    protected_text, backtick_mapping = protect_backticks(protected_text)
-    protected_mapping.update(backtick_mapping)
-    
-    # Protect regular terms
-    for i, term in enumerate(PROTECTED_TERMS):
-        placeholder = f"__PROTECTED_TERM_{i}__"
-        if term in protected_text:
-            protected_mapping[placeholder] = term
-            protected_text = protected_text.replace(term, placeholder)
-    
-    # Protect CSS classes from config
-    css_classes = exclusion_config.get('css_classes')
-    if css_classes is None:
-        css_classes = []
-    for i, css_class in enumerate(css_classes):
-        placeholder = f"__PROTECTED_CSS_{i}__"
-        if css_class in protected_text:
-            protected_mapping[placeholder] = css_class
-            protected_text = protected_text.replace(css_class, placeholder)
-    
-    # Protect text patterns from config
-    text_patterns = exclusion_config.get('text_patterns')
-    if text_patterns is None:
-        text_patterns = []
-    for i, pattern in enumerate(text_patterns):
-        placeholder = f"__PROTECTED_PATTERN_{i}__"
-        if pattern in protected_text:
-            protected_mapping[placeholder] = pattern
-            protected_text = protected_text.replace(pattern, placeholder)
-    
-    return protected_text, protected_mapping
+    return pattern.sub(replace_token, text), protected_mapping
 
 
 def restore_terms(text: str, protected_mapping: dict) -> str:
     """Restore protected terms from placeholders."""
-    restored_text = text
-    # Restore in reverse order to avoid conflicts (exclude_col placeholders first)
-    # Sort by placeholder name to ensure consistent order
-    sorted_items = sorted(protected_mapping.items(), key=lambda x: x[0], reverse=True)
-    for placeholder, original_term in sorted_items:
-        restored_text = restored_text.replace(placeholder, original_term)
-    return restored_text
-
-
-def is_table_line(line: str) -> bool:
-    """Check if a line is part of a markdown table."""
-    stripped = line.strip()
+    if not protected_mapping:
+        return text
+    # Placeholders share a fixed shape, so a single scan restores all of them
+    return PLACEHOLDER_PATTERN.sub(lambda match: protected_mapping.get(match.group(0), match.group(0)), text)
+
+
+def is_table_line(line: str, stripped: str | None = None) -> bool:
+    """
+    Check if a line is part of a markdown table.
+    
+    Callers that already have line.strip() can pass it as stripped to avoid
+    stripping the line again.
+    """
+    if stripped is None:
+        stripped = line.strip()
     # Table line should start and end with | or contain | with proper spacing
     return stripped.startswith('|') and stripped.endswith('|') and '|' in stripped[1:-1]
 
@@ -615,36 +1169,17 @@ def parse_table_line(line: str) -> List[str]:
     return parts
 
 
-def find_table_ranges(lines: List[str]) -> List[Tuple[int, int]]:
-    """
-    Find all table ranges in lines.
-    Returns list of (start_index, end_index) tuples.
-    """
-    table_ranges = []
-    i = 0
-    while i < len(lines):
-        if is_table_line(lines[i]):
-            start = i
-            # Find the end of the table
-            i += 1
-            while i < len(lines) and is_table_line(lines[i]):
-                i += 1
-            end = i
-            # Only include if we have at least 2 lines (header + separator)
-            if end - start >= 2:
-                table_ranges.append((start, end))
-        else:
-            i += 1
-    return table_ranges
-
-
-def find_headers_with_numbers(lines: List[str]) -> Tuple[dict, dict, dict]:
+def scan_markdown_structure(lines: List[str]) -> Tuple[Tuple[dict, dict, dict], List[Tuple[int, int, str | None]]]:
     """
-    Find all h1, h2, and h3 headers and assign numbers.
-    Returns (h1_dict, h2_dict, h3_dict) where:
+    Find numbered headers and tables in a single pass over the lines.
+    
+    Returns (headers, tables) where headers is (h1_dict, h2_dict, h3_dict):
     - h1_dict: {number: (index, text)}
     - h2_dict: {h1_number: {h2_number: (index, text)}}
     - h3_dict: {h1_number: {h2_number: {h3_number: (index, text)}}}
+    and tables is a list of (start_index, end_index, preceding_header) for each
+    run of at least 2 table lines (header + separator). preceding_header is the
+    closest h2/h3 above the table, or None if an h1 comes first.
     """
     h1_dict = {}
     h2_dict = {}
@@ -655,8 +1190,26 @@ def find_headers_with_numbers(lines: List[str]) -> Tuple[dict, dict, dict]:
     current_h1 = 0
     current_h2_map = {}  # Track current h2 number per h1
     
+    tables = []
+    table_start = None
+    preceding_header = None
+    
     for i, line in enumerate(lines):
         stripped = line.strip()
+        first = stripped[:1]
+        
+        # Tables: runs of consecutive table lines (same test as is_table_line)
+        if first == '|' and stripped.endswith('|') and '|' in stripped[1:-1]:
+            if table_start is None:
+                table_start = i
+            continue
+        if table_start is not None:
+            if i - table_start >= 2:
+                tables.append((table_start, i, preceding_header))
+            table_start = None
+        
+        if first != '#':
+            continue
         if stripped.startswith('# '):
             h1_counter += 1
             h1_dict[h1_counter] = (i, stripped)
@@ -664,55 +1217,85 @@ def find_headers_with_numbers(lines: List[str]) -> Tuple[dict, dict, dict]:
             h3_counters[h1_counter] = {}
             current_h1 = h1_counter
             current_h2_map[current_h1] = 0
+            # Tables never use an h1 as their header
+            preceding_header = None
         elif stripped.startswith('## '):
+            preceding_header = stripped
             # Find which h1 this h2 belongs to
             if current_h1 > 0:
                 h2_counters[current_h1] += 1
                 h2_number = h2_counters[current_h1]
-                if current_h1 not in h2_dict:
-                    h2_dict[current_h1] = {}
-                h2_dict[current_h1][h2_number] = (i, stripped)
-                if current_h1 not in h3_dict:
-                    h3_dict[current_h1] = {}
-                h3_dict[current_h1][h2_number] = {}
+                h2_dict.setdefault(current_h1, {})[h2_number] = (i, stripped)
+                h3_dict.setdefault(current_h1, {})[h2_number] = {}
                 h3_counters[current_h1][h2_number] = 0
                 current_h2_map[current_h1] = h2_number
         elif stripped.startswith('### '):
+            preceding_header = stripped
             if current_h1 > 0:
                 current_h2 = current_h2_map.get(current_h1, 0)
                 if current_h2 > 0:
-                    if current_h1 not in h3_counters:
-                        h3_counters[current_h1] = {}
-                    if current_h2 not in h3_counters[current_h1]:
-                        h3_counters[current_h1][current_h2] = 0
-                    h3_counters[current_h1][current_h2] += 1
-                    h3_number = h3_counters[current_h1][current_h2]
-                    if current_h1 not in h3_dict:
-                        h3_dict[current_h1] = {}
-                    if current_h2 not in h3_dict[current_h1]:
-                        h3_dict[current_h1][current_h2] = {}
-                    h3_dict[current_h1][current_h2][h3_number] = (i, stripped)
-    
-    return h1_dict, h2_dict, h3_dict
-
-
-def get_table_config_by_header(table_configs: List[dict], header_text: str) -> dict | None:
-    """Find table config by matching header text."""
-    for config in table_configs:
-        if config.get('match_by_header') == header_text:
-            return config
-    return None
+                    h1_h3_counters = h3_counters.setdefault(current_h1, {})
+                    h3_number = h1_h3_counters.get(current_h2, 0) + 1
+                    h1_h3_counters[current_h2] = h3_number
+                    h3_dict.setdefault(current_h1, {}).setdefault(current_h2, {})[h3_number] = (i, stripped)
+    
+    if table_start is not None and len(lines) - table_start >= 2:
+        tables.append((table_start, len(lines), preceding_header))
+    
+    return (h1_dict, h2_dict, h3_dict), tables
 
 
-def get_table_config_by_number(table_configs: List[dict], table_number: int) -> dict | None:
-    """Find table config by table number."""
+def index_table_configs(table_configs: List[dict]) -> tuple[dict, dict]:
+    """
+    Index table configs by header text and by table number.
+    
+    Returns (by_header, by_number); as with a linear scan, the first config
+    listed for a header or number wins.
+    """
+    by_header = {}
+    by_number = {}
     for config in table_configs:
-        if config.get('table_number') == table_number:
-            return config
-    return None
+        header_text = config.get('match_by_header')
+        if header_text is not None:
+            by_header.setdefault(header_text, config)
+        table_number = config.get('table_number')
+        if table_number is not None:
+            by_number.setdefault(table_number, config)
+    return by_header, by_number
 
 
-def get_header_translation(header_configs: List[dict], header_text: str, header_level: int,
+def index_header_configs(header_configs: List[dict]) -> dict[tuple, tuple[int, dict]]:
+    """
+    Index header configs for get_header_translation.
+    
+    Keys are (level, 'text', text) plus, depending on the level,
+    (1, 'number', number), (2, 'number', parent_h1_number, number) or
+    (3, 'number', parent_h1_number, parent_h2_number, number), where a None
+    parent matches any header. Values are (position, translations) of the
+    first config with that key, so the earliest matching config still wins.
+    Configs without translations never match and are left out.
+    """
+    index = {}
+    for position, config in enumerate(header_configs):
+        if 'translations' not in config:
+            continue
+        level = config.get('level')
+        number = config.get('number')
+        keys = []
+        if 'text' in config:
+            keys.append((level, 'text', config['text']))
+        if level == 1 and 'number' in config:
+            keys.append((1, 'number', number))
+        elif level == 2:
+            keys.append((2, 'number', config.get('parent_h1_number'), number))
+        elif level == 3 and number is not None:
+            keys.append((3, 'number', config.get('parent_h1_number'), config.get('parent_h2_number'), number))
+        for key in keys:
+            index.setdefault(key, (position, config['translations']))
+    return index
+
+
+def get_header_translation(header_index: dict[tuple, tuple[int, dict]], header_text: str, header_level: int,
                           h1_number: int | None = None, h2_number: int | None = None,
                           h3_number: int | None = None,
                           language: str = None) -> str | None:
@@ -720,7 +1303,7 @@ def get_header_translation(header_configs: List[dict], header_text: str, header_
     Get manual translation for a header.
     
     Args:
-        header_configs: List of header configs from file
+        header_index: Header configs of the file, indexed by index_header_configs
         header_text: The header text to match
         header_level: 1 for h1, 2 for h2, 3 for h3
         h1_number: H1 number (for h2/h3 identification)
@@ -731,47 +1314,28 @@ def get_header_translation(header_configs: List[dict], header_text: str, header_
     Returns:
         Translated header text or None if not found
     """
-    if not language:
+    if not language or not header_index:
         return None
     
-    for config in header_configs:
-        if config.get('level') != header_level:
-            continue
-        
-        # Check if this config matches
-        matched = False
-        
-        if header_level == 1:
-            # H1: match by text or number
-            if 'text' in config and config['text'] == header_text:
-                matched = True
-            elif 'number' in config and h1_number:
-                if config.get('number') == h1_number:
-                    matched = True
-        elif header_level == 2:
-            # H2: match by text or by parent_h1_number + number
-            if 'text' in config and config['text'] == header_text:
-                matched = True
-            elif h1_number and h2_number:
-                if config.get('parent_h1_number') == h1_number and config.get('number') == h2_number:
-                    matched = True
-        elif header_level == 3:
-            if 'text' in config and config['text'] == header_text:
-                matched = True
-            else:
-                number = config.get('number')
-                if number is not None:
-                    parent_h1 = config.get('parent_h1_number')
-                    parent_h2 = config.get('parent_h2_number')
-                    if ((parent_h1 is None or parent_h1 == h1_number) and
-                            (parent_h2 is None or parent_h2 == h2_number) and
-                            number == h3_number):
-                        matched = True
-        
-        if matched and 'translations' in config:
-            return config['translations'].get(language)
-    
-    return None
+    # Headers match by text, or by their number (and parent numbers)
+    candidates = [header_index.get((header_level, 'text', header_text))]
+    if header_level == 1:
+        if h1_number:
+            candidates.append(header_index.get((1, 'number', h1_number)))
+    elif header_level == 2:
+        if h1_number and h2_number:
+            candidates.append(header_index.get((2, 'number', h1_number, h2_number)))
+    elif header_level == 3:
+        for parent_h1 in (h1_number, None):
+            for parent_h2 in (h2_number, None):
+                candidates.append(header_index.get((3, 'number', parent_h1, parent_h2, h3_number)))
+    
+    matches = [match for match in candidates if match is not None]
+    if not matches:
+        return None
+    # The first matching config in the file's list wins
+    _, translations = min(matches, key=lambda match: match[0])
+    return translations.get(language)
 
 
 def process_table_line(line: str, exclude_columns: List[int] = None, 
@@ -813,85 +1377,64 @@ def process_table_line(line: str, exclude_columns: List[int] = None,
     return '| ' + ' | '.join(processed_columns) + ' |'
 
 
-def restore_table_line(line: str) -> str:
-    """Restore excluded columns in a table line after translation."""
-    import re
-    # Pattern: __EXCLUDE_COL_N__content__EXCLUDE_COL_N__
-    # Use non-greedy match to get the shortest possible match
-    # The pattern should match: __EXCLUDE_COL_<number>__<any content>__EXCLUDE_COL_<same number>__
-    pattern = r'__EXCLUDE_COL_(\d+)__(.*?)__EXCLUDE_COL_\1__'
-    
-    def replace_placeholder(match):
-        col_num = match.group(1)
-        content = match.group(2)
-        return content
-    
-    result = re.sub(pattern, replace_placeholder, line)
-    return result
+def restore_table_line(line: str) -> str:
+    """Restore excluded columns in a table line after translation."""
+    # Keep only the column content from each __EXCLUDE_COL_N__content__EXCLUDE_COL_N__
+    return EXCLUDE_COL_PATTERN.sub(r'\2', line)
+
+
+@dataclass
+class Segment:
+    """
+    A piece of a markdown body produced by segment_markdown.
+    
+    kind is one of:
+    - "literal": original text copied to the output unchanged
+    - "translate": protected text sent to the translator, rendered according to style
+    - "manual": a line with a configured manual translation for some languages;
+      languages without one fall back to the segments in fallback
+    
+    For "html" style segments, span is the position of the translated text
+    within original.
+    """
+    kind: str
+    original: str = ""
+    text: str = ""
+    mapping: dict = field(default_factory=dict)
+    context: str = ""
+    style: str = "block"
+    span: Tuple[int, int] = (0, 0)
+    job: int = -1
+    line_idx: int = -1
+    fallback: List["Segment"] = field(default_factory=list)
+
+
+# Segment styles of single table rows, which are batched one row per line
+TABLE_ROW_STYLES = frozenset({"row", "table_excluded"})
 
 
-def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path = None, language: str = None) -> str:
+def find_manual_replacements(lines: List[str], headers: Tuple[dict, dict, dict],
+                             header_index: dict[tuple, tuple[int, dict]], text_configs: List[dict],
+                             language: str | None) -> dict[int, str]:
     """
-    Translate markdown blocks with support for table/column exclusions and manual header translations.
+    Find lines with manual (configured) translations for a language.
     
-    Args:
-        text: The text to translate
-        translator: GoogleTranslator instance
-        file_path: Path to the source file (for config lookup)
-        language: Target language code (for header translations)
+    Returns:
+        Dictionary mapping line index to the replacement line
     """
-    lines = text.splitlines()
-    original_lines = lines.copy()
-    
-    # Get configurations for tables, headers, and static texts
-    table_configs = get_table_config_for_file(file_path) if file_path else []
-    header_configs = get_header_config_for_file(file_path) if file_path else []
-    text_configs = get_text_config_for_file(file_path) if file_path else []
-    
-    # Find headers with numbers for identification
-    h1_dict, h2_dict, h3_dict = find_headers_with_numbers(lines)
-    
-    # Find table ranges
-    table_ranges = find_table_ranges(lines)
-    
-    # Map table numbers and find preceding headers for each table
-    table_info = {}  # {table_index: (table_number, preceding_header, config)}
-    table_counter = 0
-    for start, end in table_ranges:
-        table_counter += 1
-        # Find preceding header (look backwards from table start)
-        # Look for h2 (##) or h3 (###) headers
-        preceding_header = None
-        for i in range(start - 1, -1, -1):
-            if i < len(lines):
-                stripped = lines[i].strip()
-                if stripped.startswith('### '):
-                    preceding_header = stripped
-                    break
-                elif stripped.startswith('## '):
-                    preceding_header = stripped
-                    break
-                elif stripped.startswith('# '):
-                    # Stop at h1, don't use it
-                    break
-        
-        table_info[table_counter] = (start, end, preceding_header)
-    
-    # Process headers and static texts - replace with manual translations
-    processed_lines = lines.copy()
+    h1_dict, h2_dict, h3_dict = headers
     manual_line_replacements: dict[int, str] = {}
     
     # Process headers using configuration overrides
     for h1_num, (idx, h1_text) in h1_dict.items():
-        manual_trans = get_header_translation(header_configs, h1_text, header_level=1, h1_number=h1_num, language=language)
+        manual_trans = get_header_translation(header_index, h1_text, header_level=1, h1_number=h1_num, language=language)
         if manual_trans:
-            processed_lines[idx] = manual_trans
             manual_line_replacements[idx] = manual_trans
     
     for h1_num, h2_dict_inner in h2_dict.items():
         for h2_num, (idx, h2_text) in h2_dict_inner.items():
             manual_trans = get_header_translation(
-                header_configs,
+                header_index,
                 h2_text,
                 header_level=2,
                 h1_number=h1_num,
@@ -899,14 +1442,13 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
                 language=language
             )
             if manual_trans:
-                processed_lines[idx] = manual_trans
                 manual_line_replacements[idx] = manual_trans
     
     for h1_num, h2_map in h3_dict.items():
         for h2_num, h3_map in h2_map.items():
             for h3_num, (idx, h3_text) in h3_map.items():
                 manual_trans = get_header_translation(
-                    header_configs,
+                    header_index,
                     h3_text,
                     header_level=3,
                     h1_number=h1_num,
@@ -915,13 +1457,12 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
                     language=language
                 )
                 if manual_trans:
-                    processed_lines[idx] = manual_trans
                     manual_line_replacements[idx] = manual_trans
     
     # Process static text replacements
     if text_configs and language:
         match_counters = defaultdict(int)
-        for idx, original_line in enumerate(original_lines):
+        for idx, original_line in enumerate(lines):
             # Skip if line already has manual replacement (e.g., headers)
             if idx in manual_line_replacements:
                 continue
@@ -968,24 +1509,78 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
                     if leading_whitespace and not output_text.startswith(leading_whitespace):
                         output_text = f"{leading_whitespace}{output_text.lstrip(' \t')}"
                 
-                processed_lines[idx] = output_text
                 manual_line_replacements[idx] = output_text
                 break
     
-    # Store original lines for excluded tables restoration
-    original_lines_for_translation = original_lines.copy()
+    return manual_line_replacements
+
+
+def segment_markdown(text: str, file_path: Path = None,
+                     languages: Iterable[str | None] = ()) -> Tuple[List[Segment], dict]:
+    """
+    Split a markdown body into literal and translatable segments.
+    
+    Segmentation (table exclusions, code/style blocks, term protection) does not
+    depend on the target language, so it runs once per file and the segments are
+    shared by every language. Lines with manual translations for any of the given
+    languages become "manual" segments.
+    
+    Args:
+        text: The markdown body to segment
+        file_path: Path to the source file (for config lookup)
+        languages: Target language codes (for header and static text translations)
+    
+    Returns:
+        (segments, replacements) where replacements maps each language to its
+        {line_index: manual translation} dictionary
+    """
+    # Never modified: rewritten table lines are kept in line_overrides instead
+    lines = text.splitlines()
+    
+    # Get configurations for tables, headers, and static texts
+    table_configs = get_table_config_for_file(file_path) if file_path else []
+    header_index = index_header_configs(get_header_config_for_file(file_path)) if file_path else {}
+    text_configs = get_text_config_for_file(file_path) if file_path else []
+    
+    # Find numbered headers and tables (with their preceding h2/h3 header) in one pass
+    headers, tables = scan_markdown_structure(lines)
+    
+    # Number the tables for config lookup: {table_number: (start, end, preceding_header)}
+    table_info = dict(enumerate(tables, start=1))
+    
+    # Find manual translations for headers and static texts per language
+    # (most files have no header or text config, so there is nothing to look for)
+    if header_index or text_configs:
+        replacements = {
+            language: find_manual_replacements(lines, headers, header_index, text_configs, language)
+            for language in languages
+        }
+    else:
+        replacements = {language: {} for language in languages}
+    manual_lines = set()
+    for language_replacements in replacements.values():
+        manual_lines.update(language_replacements)
+    
+    # Table lines rewritten for translation, by line index; other lines are used as-is
+    line_overrides: dict[int, str] = {}
     
     # Dictionary to store table header info: {line_index: (is_header, should_translate, exclude_columns)}
     table_header_info = {}
     
+    # Lines of tables excluded from translation entirely; they are copied as-is
+    excluded_table_lines: set[int] = set()
+    
+    # Table configs keyed by preceding header text and by table number
+    tables_by_header, tables_by_number = index_table_configs(table_configs)
+    
     # Process tables - apply exclusions
     for table_num, (start, end, preceding_header) in table_info.items():
         # Find matching config
         table_config = None
         if preceding_header:
-            table_config = get_table_config_by_header(table_configs, preceding_header)
+            table_config = tables_by_header.get(preceding_header)
         if not table_config:
-            table_config = get_table_config_by_number(table_configs, table_num)
+            table_config = tables_by_number.get(table_num)
         
         # Default values for tables without config (translate headers by default)
         exclude_columns = []
@@ -995,8 +1590,7 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
             # Check if entire table should be excluded
             if table_config.get('exclude_table'):
                 # Mark all table lines as excluded
-                for i in range(start, end):
-                    processed_lines[i] = f"__EXCLUDE_TABLE_LINE_{i}__"
+                excluded_table_lines.update(range(start, end))
                 continue
             else:
                 # Get config values
@@ -1007,10 +1601,10 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
         
         # Process all table lines (including headers) - for both configured and unconfigured tables
         for i in range(start, end):
-            line = processed_lines[i]
+            line = lines[i]
             # Check if this is separator row (second row, typically contains dashes)
-            is_separator = (i == start + 1 and 
-                           ('---' in line or all(c in '-:| ' for c in line.strip())))
+            is_separator = (i == start + 1 and
+                           ('---' in line or not line.strip().translate(SEPARATOR_CHARS_TABLE)))
             is_header_row = i == start
             
             if is_separator:
@@ -1022,149 +1616,101 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
                 # For header: if exclude_header=False, translate full header (don't apply column exclusions)
                 # If exclude_header=True, don't translate header at all (no processing needed)
                 # In both cases, keep header as-is (column exclusions don't apply to headers)
-                processed_lines[i] = line
             else:
                 # Store data row info: (is_header=False, should_translate=True, exclude_columns)
                 table_header_info[i] = (False, True, exclude_columns)
                 # Process data rows: apply column exclusions
-                processed_lines[i] = process_table_line(line, exclude_columns, exclude_header, False)
+                line_overrides[i] = process_table_line(line, exclude_columns, exclude_header, False)
     
-    # Now translate the processed lines
-    lines = processed_lines
-    translated: List[str] = []
+    # Now split the processed lines into segments
+    segments: List[Segment] = []
     buffer: List[str] = []
     in_code = False
-    in_html_tag = False
     in_style_block = False
-
+    
+    def add_literal(line: str) -> None:
+        segments.append(Segment("literal", original=line))
+    
+    def add_translation(line: str, text_to_translate: str, context: str, style: str, **extra) -> None:
+        # Protect terms before translation
+        protected_text, protected_mapping = protect_terms(text_to_translate)
+        segments.append(Segment(
+            "translate", original=line, text=protected_text, mapping=protected_mapping,
+            context=context, style=style, **extra
+        ))
+    
     def flush() -> None:
         if not buffer:
             return
         chunk = "\n".join(buffer)
-        
-        # Protect terms before translation
-        protected_chunk, protected_mapping = protect_terms(chunk)
-        translated_chunk = retry_translate(translator, protected_chunk, "text block")
-        
-        # Ensure translated_chunk is not None
-        if translated_chunk is None:
-            translated_chunk = protected_chunk
-        
-        # Restore protected terms after translation
-        translated_chunk = restore_terms(translated_chunk, protected_mapping)
-        
-        # Ensure translated_chunk is still not None and is a string
-        if translated_chunk is None:
-            translated_chunk = chunk
-        
-        # Split and filter out None values
-        lines = translated_chunk.splitlines()
-        translated.extend([line for line in lines if line is not None])
+        add_translation(chunk, chunk, "text block", "block")
         buffer.clear()
-
-    for line_idx, line in enumerate(lines):
+    
+    def process_line(line_idx: int, line: str) -> None:
+        nonlocal in_code, in_style_block
         stripped = line.strip()
-        
-        # Handle manual replacements for headers and texts
-        if line_idx in manual_line_replacements:
-            flush()
-            translated.append(manual_line_replacements[line_idx])
-            continue
+        # Most lines are plain text, so dispatch on the first character and
+        # only run the more specific checks when it can match
+        first = stripped[:1]
         
         # Handle excluded table lines (entire table excluded)
-        if stripped.startswith("__EXCLUDE_TABLE_LINE_"):
-            # Restore original line from original lines
-            # Extract index from placeholder: __EXCLUDE_TABLE_LINE_{idx}__
-            try:
-                idx_str = stripped.replace("__EXCLUDE_TABLE_LINE_", "").replace("__", "")
-                original_idx = int(idx_str)
-                if original_idx < len(original_lines_for_translation):
-                    translated.append(original_lines_for_translation[original_idx])
-                else:
-                    translated.append(line)
-            except (ValueError, IndexError):
-                translated.append(line)
-            continue
+        if line_idx in excluded_table_lines:
+            flush()
+            add_literal(line)
+            return
         
         # Handle code blocks
-        if stripped.startswith(FENCE_PREFIX):
+        if first == "`" and stripped.startswith(FENCE_PREFIX):
             flush()
-            translated.append(line)
+            add_literal(line)
             in_code = not in_code
-            continue
-            
+            return
+        
         # Handle HTML style blocks
-        if stripped.startswith("<style>") or stripped.startswith("<style "):
-            flush()
-            translated.append(line)
-            in_style_block = True
-            continue
-        if stripped.startswith("</style>"):
-            flush()
-            translated.append(line)
-            in_style_block = False
-            continue
-            
+        if first == "<":
+            if stripped.startswith(STYLE_OPEN_PREFIXES):
+                flush()
+                add_literal(line)
+                in_style_block = True
+                return
+            if stripped.startswith("</style>"):
+                flush()
+                add_literal(line)
+                in_style_block = False
+                return
+        
         # Handle HTML tags - but translate text content inside them
         if "<" in line and ">" in line:
-            # Get exclusion configuration
-            exclusion_config = get_exclusion_config()
-            excluded_elements = exclusion_config.get('html_elements')
-            if excluded_elements is None:
-                excluded_elements = []
-            
             # Check if this is a simple HTML tag with text content that should be translated
-            should_translate = False
-            for tag in ["<p", "<h1", "<h2", "<h3", "<h4", "<h5", "<h6", "<span", "<div", "<a"]:
-                if tag in line and (not excluded_elements or tag[1:] not in excluded_elements):
-                    should_translate = True
-                    break
+            should_translate = any(
+                match.group(1) not in EXCLUDED_HTML_ELEMENTS for match in HTML_TEXT_TAG_PATTERN.finditer(line)
+            )
             
             if should_translate:
                 # Extract text content and translate it
-                import re
                 # Find text content between HTML tags
-                text_match = re.search(r'>([^<]+)<', line)
+                text_match = HTML_TEXT_CONTENT_PATTERN.search(line)
                 if text_match:
                     text_content = text_match.group(1).strip()
-                    if text_content and not any(term in text_content for term in PROTECTED_TERMS):
+                    if text_content and not PROTECTED_TERMS_RE.search(text_content):
                         # Check if text contains excluded patterns
-                        text_patterns = exclusion_config.get('text_patterns')
-                        if text_patterns is None:
-                            text_patterns = []
-                        if not text_patterns or not any(pattern in text_content for pattern in text_patterns):
-                            # Protect terms before translation
-                            protected_content, protected_mapping = protect_terms(text_content)
-                            translated_content = retry_translate(translator, protected_content, "HTML content")
-                            
-                            # Ensure translated_content is not None
-                            if translated_content is None:
-                                translated_content = protected_content
-                            
-                            # Restore protected terms after translation
-                            translated_content = restore_terms(translated_content, protected_mapping)
-                            
-                            # Ensure final content is not None
-                            if translated_content is not None:
-                                # Replace the text content in the line
-                                translated_line = line.replace(text_content, translated_content)
-                                translated.append(translated_line)
-                            else:
-                                translated.append(line)
-                            continue
+                        if EXCLUDED_TEXT_PATTERN_RE is None or not EXCLUDED_TEXT_PATTERN_RE.search(text_content):
+                            # Translated content replaces the (stripped) text content in the line
+                            start = text_match.start(1) + text_match.group(1).index(text_content)
+                            add_translation(line, text_content, "HTML content", "html",
+                                            span=(start, start + len(text_content)))
+                            return
             flush()
-            translated.append(line)
-            continue
+            add_literal(line)
+            return
         
         # Handle table lines (with column exclusions)
         # Process table lines individually to preserve structure and handle exclusions
-        if is_table_line(line):
+        if first == "|" and is_table_line(line, stripped):
             flush()
             
             # Check if this line is a table header and if it should be translated
             header_info = table_header_info.get(line_idx)
-            is_header = False
-            should_translate = True
             
             if header_info:
                 is_header, should_translate, exclude_columns = header_info
@@ -1172,351 +1718,532 @@ def translate_blocks(text: str, translator: GoogleTranslator, file_path: Path =
                 # If this is a header and should not be translated, skip translation
                 if is_header and not should_translate:
                     # Header should not be translated - restore without translation
-                    translated_line = restore_table_line(line)
-                    translated.append(translated_line)
-                    continue
+                    add_literal(restore_table_line(line))
+                    return
             
             # For headers with exclude_header: false, translate full header (no column exclusions)
             # For data rows, apply column exclusions if any
             # Check if line has excluded columns (placeholders) - only for data rows
-            has_excluded_columns = "__EXCLUDE_COL_" in line
-            
-            if has_excluded_columns:
-                # Line has excluded columns - need to translate while preserving placeholders
-                # This should only happen for data rows, not headers
-                # Protect excluded column placeholders and other terms
-                protected_line, protected_mapping = protect_terms(line)
-                
-                # Translate the line (placeholders will be preserved)
-                translated_line = retry_translate(translator, protected_line, "table line with excluded columns")
-                
-                # Ensure translated_line is not None
-                if translated_line is None:
-                    translated_line = protected_line
-                
-                # Restore protected terms (including excluded column placeholders)
-                translated_line = restore_terms(translated_line, protected_mapping)
-                # Restore excluded columns (extract content from placeholders)
-                translated_line = restore_table_line(translated_line)
-                
-                translated.append(translated_line)
+            if "__EXCLUDE_COL_" in line:
+                # Line has excluded columns - placeholders are protected during translation
+                # and restored (with the column content extracted) afterwards
+                add_translation(line, line, "table line with excluded columns", "table_excluded")
             else:
                 # Normal table line without excluded columns - translate normally
                 # This includes headers with exclude_header: false (they have no placeholders)
-                protected_line, protected_mapping = protect_terms(line)
-                translated_line = retry_translate(translator, protected_line, "table line")
-                
-                # Ensure translated_line is not None
-                if translated_line is None:
-                    translated_line = protected_line
-                
-                translated_line = restore_terms(translated_line, protected_mapping)
-                translated.append(translated_line)
-            
-            continue
-            
+                add_translation(line, line, "table line", "row")
+            return
+        
         # Skip code blocks, empty lines, and style blocks
-        if in_code or not stripped or in_style_block or stripped.startswith("```"):
+        if in_code or not stripped or in_style_block:
             flush()
-            translated.append(line)
-            continue
-            
+            add_literal(line)
+            return
+        
         # Handle blockquotes
-        if stripped.startswith(">"):
+        if first == ">":
             flush()
             quote_content = line.lstrip("> ").strip()
-            # Protect terms before translation
-            protected_content, protected_mapping = protect_terms(quote_content)
-            translated_content = retry_translate(translator, protected_content, "blockquote")
-            
-            # Ensure translated_content is not None
-            if translated_content is None:
-                translated_content = protected_content
-            
-            # Restore protected terms after translation
-            translated_content = restore_terms(translated_content, protected_mapping)
-            
-            # Ensure final content is not None
-            if translated_content is not None:
-                translated.append("> " + translated_content)
+            if quote_content:
+                add_translation(line, quote_content, "blockquote", "quote")
             else:
-                translated.append(line)
-            continue
+                # Nothing to translate in an empty quote line
+                add_literal(line)
+            return
         
         # Handle headers - flush buffer before adding header to ensure proper translation
-        # Headers that were statically replaced should be added directly without translation
-        # Headers without static replacement should be translated separately
-        if stripped.startswith("#"):
+        # Headers without static replacement are translated separately
+        if first == "#":
             flush()
-            # Check if header has manual replacement (static translation)
-            if line_idx in manual_line_replacements:
-                translated.append(manual_line_replacements[line_idx])
-            else:
-                # Header was not statically replaced - translate it separately
-                protected_line, protected_mapping = protect_terms(line)
-                translated_line = retry_translate(translator, protected_line, "header")
-                
-                # Ensure translated_line is not None
-                if translated_line is None:
-                    translated_line = protected_line
-                
-                # Restore protected terms after translation
-                translated_line = restore_terms(translated_line, protected_mapping)
-                translated.append(translated_line)
-            continue
-            
+            add_translation(line, line, "header", "line")
+            return
+        
         buffer.append(line)
-
+    
+    for line_idx, line in enumerate(lines):
+        line = line_overrides.get(line_idx, line)
+        if line_idx in manual_lines:
+            # Lines with manual translations stand alone; languages without one
+            # fall back to the regular handling of the line
+            flush()
+            mark = len(segments)
+            process_line(line_idx, line)
+            flush()
+            fallback = segments[mark:]
+            del segments[mark:]
+            segments.append(Segment("manual", line_idx=line_idx, fallback=fallback))
+            continue
+        process_line(line_idx, line)
+    
     flush()
-    # Filter out any None values before joining
-    translated = [line for line in translated if line is not None]
-    return "\n".join(translated)
-
-
-async def translate_blocks_async(text: str, translator: GoogleTranslator, semaphore: asyncio.Semaphore,
-                                 file_path: Path = None, language: str = None) -> str:
-    """Async version of translate_blocks with rate limiting."""
-    async with semaphore:
-        # Run the synchronous translation in a thread pool
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            result = await loop.run_in_executor(
-                executor, translate_blocks, text, translator, file_path, language
-            )
-        await asyncio.sleep(TRANSLATION_DELAY)  # Rate limiting
-        return result
+    
+    # Number the translatable segments so per-language results can be looked up
+    job = 0
+    for segment in iter_segments(segments):
+        if segment.kind == "translate":
+            segment.job = job
+            job += 1
+    
+    return segments, replacements
 
 
-def translate_file(path: Path, targets: Iterable[str]) -> None:
-    content = path.read_text(encoding="utf-8")
-    front_matter, body = split_front_matter(content)
+def iter_segments(segments: List[Segment]) -> Iterator[Segment]:
+    """Iterate over segments, descending into manual fallbacks."""
+    for segment in segments:
+        yield segment
+        if segment.kind == "manual":
+            yield from segment.fallback
 
-    for lang in targets:
-        suffix = TRANSLATION_SUFFIXES.get(lang, f".{lang}.md")
-        translator = GoogleTranslator(source="auto", target=lang)
-        translated_body = translate_blocks(body, translator, file_path=path, language=lang)
+
+def iter_translation_jobs(segments: List[Segment], replacements: dict) -> Iterator[Tuple[Segment, List[str]]]:
+    """
+    Yield each translatable segment together with the languages that need it.
+    
+    Fallback segments of a manual line are only needed by languages that have
+    no manual translation for that line.
+    """
+    all_languages = list(replacements)
+    for segment in segments:
+        if segment.kind == "translate":
+            yield segment, all_languages
+        elif segment.kind == "manual":
+            languages = [lang for lang in all_languages if segment.line_idx not in replacements[lang]]
+            if not languages:
+                continue
+            for fallback in segment.fallback:
+                if fallback.kind == "translate":
+                    yield fallback, languages
+
+
+def render_translation(segment: Segment, translated: str | None) -> str:
+    """Turn a translated segment back into output text (may span several lines)."""
+    # Ensure translated text is not None
+    if translated is None:
+        translated = segment.text
+    
+    # Restore protected terms after translation
+    translated = restore_terms(translated, segment.mapping)
+    
+    if segment.style == "html":
+        # Splice the translation in where the text content was found
+        start, end = segment.span
+        return segment.original[:start] + translated + segment.original[end:]
+    if segment.style == "table_excluded":
+        # Restore excluded columns (extract content from placeholders)
+        return restore_table_line(translated)
+    if segment.style == "quote":
+        return "> " + translated
+    return translated
+
+
+def render_segments(segments: List[Segment], translations: dict[int, str], replacements: dict[int, str]) -> str:
+    """
+    Assemble the translated body for one language.
+    
+    Each segment contributes one string (a translated paragraph may span several
+    lines), and the pieces are joined once at the end.
+    """
+    out_parts: List[str] = []
+    append = out_parts.append  # Bound once; called for every segment
+    for segment in segments:
+        if segment.kind == "manual":
+            manual_trans = replacements.get(segment.line_idx)
+            if manual_trans is not None:
+                append(manual_trans)
+                continue
+            parts = segment.fallback
+        else:
+            parts = (segment,)
+        for part in parts:
+            if part.kind != "translate":
+                append(part.original)
+                continue
+            rendered = render_translation(part, translations.get(part.job))
+            # An empty translated paragraph contributes no lines
+            if rendered or part.style != "block":
+                append(rendered)
+    return "\n".join(out_parts)
+
+
+def plan_translation_batches(segments: List[Segment]) -> List[Tuple[str, List[str], str]]:
+    """
+    Group the segments one language still needs into translate requests.
+    
+    Identical texts are sent once. Table rows are joined with newlines, at most
+    TABLE_ROW_BATCH_SIZE per request; other segments never contain blank lines,
+    so they are joined with one. A request only exceeds TRANSLATE_BATCH_MAX_CHARS
+    when a single text does.
+    
+    Returns:
+        (separator, texts, context) for each request
+    """
+    rows = {}
+    blocks = {}
+    for segment in segments:
+        group = rows if segment.style in TABLE_ROW_STYLES else blocks
+        group.setdefault(segment.text, segment.context)
+    
+    batches = []
+    for texts, separator, max_items, label in ((rows, "\n", TABLE_ROW_BATCH_SIZE, "table rows"),
+                                               (blocks, "\n\n", None, "text blocks")):
+        batch: List[str] = []
+        size = 0
+        for text in texts:
+            if batch and (size + len(text) > TRANSLATE_BATCH_MAX_CHARS or len(batch) == max_items):
+                batches.append((separator, batch, label, texts))
+                batch = []
+                size = 0
+            batch.append(text)
+            size += len(text) + len(separator)
+        if batch:
+            batches.append((separator, batch, label, texts))
+    
+    # A request with a single text keeps that segment's own context for error messages
+    return [
+        (separator, batch, label if len(batch) > 1 else texts[batch[0]])
+        for separator, batch, label, texts in batches
+    ]
+
+
+def translate_segments(segments: List[Segment], translator: GoogleTranslator, replacements: dict[int, str],
+                       language: str | None = None) -> dict[int, str]:
+    """Translate the segments needed by a single language."""
+    jobs = [segment for segment, _ in iter_translation_jobs(segments, {language: replacements})]
+    if not jobs:
+        # Nothing but code, markup and manual translations: no cache lookup or request
+        return {}
+    cached = lookup_cached_translations(translator, (segment.text for segment in jobs))
+    translations = {}
+    pending = []
+    for segment in jobs:
+        translation = cached.get(segment.text)
+        if translation is None:
+            pending.append(segment)
+        else:
+            translations[segment.job] = translation
+    
+    # Several segments go out in each request
+    results = {}
+    for separator, texts, context in plan_translation_batches(pending):
+        results.update(zip(texts, translate_fields(translator, texts, context, separator=separator)))
+    for segment in pending:
+        translations[segment.job] = results[segment.text]
+    return translations
+
+
+async def translate_admitted(admission: AdmissionController, func: Callable, *args):
+    """
+    Run a translation function in a worker thread with adaptive rate limiting.
+    
+    func is called with args plus an on_error callback, like retry_translate.
+    """
+    errors: List[Exception] = []
+    async with admission:
+        result = await asyncio.to_thread(func, *args, errors.append)
+    if any(isinstance(error, TooManyRequests) for error in errors):
+        await admission.shrink()
+    elif not errors:
+        await admission.record_success()
+    return result
+
+
+async def translate_segments_async(segments: List[Segment], translators: dict, replacements: dict,
+                                   admission: AdmissionController) -> dict[str, dict[int, str]]:
+    """
+    Translate segments into all languages at once.
+    
+    The segments each language still needs are batched into requests, and the
+    requests of all languages run concurrently, so the segmentation work is
+    shared across languages.
+    """
+    translations = {lang: {} for lang in translators}
+    jobs = list(iter_translation_jobs(segments, replacements))
+    if not jobs:
+        # Nothing but code, markup and manual translations: no cache lookup or request
+        return translations
+    
+    # Cache hits are filled in up front so they skip the worker threads and admission control
+    cached = {
+        lang: await asyncio.to_thread(
+            lookup_cached_translations, translator,
+            [segment.text for segment, languages in jobs if lang in languages]
+        )
+        for lang, translator in translators.items()
+    }
+    
+    pending = {lang: [] for lang in translators}
+    for segment, languages in jobs:
+        for lang in languages:
+            translation = cached[lang].get(segment.text)
+            if translation is None:
+                pending[lang].append(segment)
+            else:
+                translations[lang][segment.job] = translation
+    
+    # Several segments go out in each request
+    batches = [(lang, batch) for lang, lang_pending in pending.items()
+               for batch in plan_translation_batches(lang_pending)]
+    results = await asyncio.gather(*(
+        translate_admitted(admission, functools.partial(translate_fields, separator=separator),
+                           translators[lang], texts, context)
+        for lang, (separator, texts, context) in batches
+    ))
+    by_text = {lang: {} for lang in translators}
+    for (lang, (_, texts, _)), batch_results in zip(batches, results):
+        by_text[lang].update(zip(texts, batch_results))
+    for lang, lang_pending in pending.items():
+        for segment in lang_pending:
+            translations[lang][segment.job] = by_text[lang][segment.text]
+    return translations
+
+
+def translate_file(path: Path, targets: Iterable[str], parsed: tuple[str | None, str] | None = None) -> None:
+    if parsed is None:
+        parsed = split_front_matter(path.read_text(encoding="utf-8"))
+    front_matter, body = parsed
+    
+    # Skip languages whose output is already up to date
+    manifest = get_translation_manifest()
+    source_hash = manifest.source_hash(front_matter, body)
+    targets = pending_languages(path, targets, source_hash)
+    if not targets:
+        return
+    failures: List[str] = []
+    TRANSLATION_FAILURES.set(failures)
+    
+    # Segment the body once and reuse it for every language
+    segments, replacements = segment_markdown(body, path, targets)
+    # Default metadata for files without front matter, shared by every language
+    metadata = None if front_matter else get_metadata_for_file(path, None)
+
+    for lang, output_path in targets.items():
+        translator = get_translator(lang)
+        translations = translate_segments(segments, translator, replacements[lang], lang)
+        translated_body = render_segments(segments, translations, replacements[lang])
         
         # Translate front matter if present (with metadata override support)
         translated_front_matter = front_matter
         if front_matter:
-            # Check if front matter has title or description
-            has_title = 'title:' in front_matter
-            has_description = 'description:' in front_matter
-            
-            # If front matter exists but lacks title/description, add metadata
-            if not has_title or not has_description:
-                metadata = get_metadata_for_file(path, None)  # Get default metadata
-                if metadata:
-                    translated_front_matter = add_metadata_to_front_matter(
-                        front_matter, metadata, lang=lang, translator=translator, file_path=path
-                    )
-                else:
-                    # No metadata, just translate existing front matter
-                    translated_front_matter = translate_front_matter(
-                        front_matter, translator, file_path=path, target_lang=lang
-                    )
-            else:
-                # Front matter has title/description, just translate it
-                translated_front_matter = translate_front_matter(
-                    front_matter, translator, file_path=path, target_lang=lang
-                )
-        else:
+            # Translate title/description, adding missing ones from the metadata config
+            translated_front_matter = translate_front_matter(
+                front_matter, translator, file_path=path, target_lang=lang
+            )
+        elif metadata:
             # If no front matter exists, create one with metadata if available
-            metadata = get_metadata_for_file(path, None)  # Get default metadata
-            if metadata and (metadata.get('title') or metadata.get('description')):
-                front_matter_lines = ["---"]
-                # Get language-specific metadata if available
-                lang_metadata = get_metadata_for_file(path, lang) if lang else {}
-                
-                if lang_metadata and lang_metadata.get('title'):
-                    front_matter_lines.append(f"title: {lang_metadata['title']}")
-                elif metadata.get('title'):
-                    # Translate default title if no language-specific version
-                    if not lang_metadata or not lang_metadata.get('title'):
-                        translated_title = retry_translate(translator, metadata['title'], "metadata title")
-                        front_matter_lines.append(f"title: {translated_title}")
-                    else:
-                        front_matter_lines.append(f"title: {metadata['title']}")
-                
-                if lang_metadata and lang_metadata.get('description'):
-                    front_matter_lines.append(f"description: {lang_metadata['description']}")
-                elif metadata.get('description'):
-                    # Translate default description if no language-specific version
-                    if not lang_metadata or not lang_metadata.get('description'):
-                        translated_description = retry_translate(translator, metadata['description'], "metadata description")
-                        front_matter_lines.append(f"description: {translated_description}")
-                    else:
-                        front_matter_lines.append(f"description: {metadata['description']}")
-                
-                front_matter_lines.append("---")
-                translated_front_matter = "\n".join(front_matter_lines)
+            translated_front_matter = build_metadata_front_matter(
+                metadata, get_metadata_for_file(path, lang), translator
+            )
         
-        pieces = []
-        if translated_front_matter:
-            pieces.append(translated_front_matter)
-            pieces.append("")
-        pieces.append(translated_body)
-        output_path = build_translation_path(path, suffix)
-        output_path.write_text("\n".join(pieces).strip() + "\n", encoding="utf-8")
-
-
-async def translate_single_language(path: Path, lang: str, body: str, front_matter: str | None, 
-                                   semaphore: asyncio.Semaphore, progress_bar: tqdm) -> None:
-    """Translate a single file to a single language."""
+        write_file(output_path, compose_output(translated_front_matter, translated_body))
+        if not failures:
+            manifest.record(path, lang, source_hash)
+
+
+def write_file(path: Path, content: str) -> None:
+    """
+    Write UTF-8 text to path atomically.
+    
+    The content is encoded once and written with os.write to a hidden temporary
+    file next to path, which then replaces it, so readers such as mkdocs serve
+    never see a half-written page. Newlines are written as-is on every platform,
+    and an existing file keeps its permissions.
+    """
+    data = memoryview(content.encode("utf-8"))
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    # O_BINARY (Windows only) keeps the C runtime from turning \n into \r\n
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    if mode is not None:
+        # os.open applies the umask, so copy the target's mode explicitly
+        os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+async def aread(path: Path) -> str:
+    """Read a text file in a worker thread (open, read and close in one hop)."""
+    return await asyncio.to_thread(path.read_text, encoding="utf-8")
+
+
+async def awrite(path: Path, content: str) -> None:
+    """Write a text file in a worker thread (open, write and close in one hop)."""
+    await asyncio.to_thread(write_file, path, content)
+
+
+def update_progress_description(progress_bar: tqdm, description: str) -> None:
+    """Set the progress bar description at most once per PROGRESS_DESCRIPTION_INTERVAL."""
+    now = time.monotonic()
+    if now - getattr(update_progress_description, '_last', 0.0) >= PROGRESS_DESCRIPTION_INTERVAL:
+        update_progress_description._last = now
+        # The next update() call redraws the bar, so skip the extra refresh here
+        progress_bar.set_description(description, refresh=False)
+
+
+async def translate_single_language(path: Path, lang: str, output_path: Path, translated_body: str,
+                                   front_matter: str | None, translator: GoogleTranslator,
+                                   admission: AdmissionController, progress_bar: tqdm,
+                                   metadata: dict | None = None) -> bool:
+    """
+    Translate the front matter of a file and write its translation for a single language.
+    
+    metadata is the file's default metadata, used to create front matter when
+    the file has none. Front matter requests go through admission like the body's.
+    
+    Returns:
+        True if the translation was written, False if it failed
+    """
     try:
-        suffix = TRANSLATION_SUFFIXES.get(lang, f".{lang}.md")
-        translator = GoogleTranslator(source="auto", target=lang)
-        translated_body = await translate_blocks_async(body, translator, semaphore, file_path=path, language=lang)
-        
         # Translate front matter if present (with metadata override support)
         translated_front_matter = front_matter
         if front_matter:
-            # Check if front matter has title or description
-            has_title = 'title:' in front_matter
-            has_description = 'description:' in front_matter
-            
-            # If front matter exists but lacks title/description, add metadata
-            if not has_title or not has_description:
-                metadata = get_metadata_for_file(path, None)  # Get default metadata
-                if metadata:
-                    # Run add_metadata_to_front_matter in thread pool
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor() as executor:
-                        translated_front_matter = await loop.run_in_executor(
-                            executor, add_metadata_to_front_matter, 
-                            front_matter, metadata, lang, translator, path
-                        )
-                else:
-                    # No metadata, just translate existing front matter
-                    loop = asyncio.get_event_loop()
-                    with ThreadPoolExecutor() as executor:
-                        translated_front_matter = await loop.run_in_executor(
-                            executor, translate_front_matter, front_matter, translator, path, lang
-                        )
-            else:
-                # Front matter has title/description, just translate it
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor() as executor:
-                    translated_front_matter = await loop.run_in_executor(
-                        executor, translate_front_matter, front_matter, translator, path, lang
-                    )
-        else:
+            # Translate title/description (adding missing ones from the metadata config) in a worker thread
+            translated_front_matter = await translate_admitted(
+                admission, translate_front_matter, front_matter, translator, path, lang
+            )
+        elif metadata:
             # If no front matter exists, create one with metadata if available
-            metadata = get_metadata_for_file(path, None)  # Get default metadata
-            if metadata and (metadata.get('title') or metadata.get('description')):
-                front_matter_lines = ["---"]
-                # Get language-specific metadata if available
-                lang_metadata = get_metadata_for_file(path, lang) if lang else {}
-                
-                if lang_metadata and lang_metadata.get('title'):
-                    front_matter_lines.append(f"title: {lang_metadata['title']}")
-                elif metadata.get('title'):
-                    # Translate default title if no language-specific version
-                    if not lang_metadata or not lang_metadata.get('title'):
-                        translated_title = retry_translate(translator, metadata['title'], "metadata title")
-                        front_matter_lines.append(f"title: {translated_title}")
-                    else:
-                        front_matter_lines.append(f"title: {metadata['title']}")
-                
-                if lang_metadata and lang_metadata.get('description'):
-                    front_matter_lines.append(f"description: {lang_metadata['description']}")
-                elif metadata.get('description'):
-                    # Translate default description if no language-specific version
-                    if not lang_metadata or not lang_metadata.get('description'):
-                        translated_description = retry_translate(translator, metadata['description'], "metadata description")
-                        front_matter_lines.append(f"description: {translated_description}")
-                    else:
-                        front_matter_lines.append(f"description: {metadata['description']}")
-                
-                front_matter_lines.append("---")
-                translated_front_matter = "\n".join(front_matter_lines)
-        
-        pieces = []
-        if translated_front_matter:
-            pieces.append(translated_front_matter)
-            pieces.append("")
-        pieces.append(translated_body)
-        output_path = build_translation_path(path, suffix)
+            translated_front_matter = await translate_admitted(
+                admission, build_metadata_front_matter, metadata, get_metadata_for_file(path, lang), translator
+            )
         
-        async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
-            await f.write("\n".join(pieces).strip() + "\n")
+        await awrite(output_path, compose_output(translated_front_matter, translated_body))
         
-        progress_bar.set_description(f"Translated {path.name} to {lang}")
-        progress_bar.update(1)
+        update_progress_description(progress_bar, f"Translated {path.name} to {lang}")
+        return True
         
     except Exception as e:
         print(f"Error translating {path.name} to {lang}: {e}")
-        progress_bar.update(1)
+        return False
 
 
-async def translate_file_async(path: Path, targets: List[str], semaphore: asyncio.Semaphore, progress_bar: tqdm) -> None:
-    """Async version of translate_file with parallel language translation."""
+async def translate_file_async(
+    path: Path,
+    targets: List[str],
+    admission: AdmissionController,
+    progress_bar: tqdm,
+    parsed: tuple[str | None, str] | None = None,
+) -> None:
+    """
+    Async version of translate_file.
+    
+    The body is segmented once and every segment is translated into all target
+    languages concurrently; front matter and output are then handled per language.
+    If ``parsed`` is given it is used instead of re-reading and re-splitting the file.
+    """
     try:
-        async with aiofiles.open(path, 'r', encoding='utf-8') as f:
-            content = await f.read()
+        if parsed is None:
+            content = await aread(path)
+            parsed = split_front_matter(content)
+        front_matter, body = parsed
         
-        front_matter, body = split_front_matter(content)
+        # Skip languages whose output is already up to date
+        manifest = get_translation_manifest()
+        source_hash = manifest.source_hash(front_matter, body)
+        pending = pending_languages(path, targets, source_hash)
+        progress_bar.update(len(targets) - len(pending))
+        if not pending:
+            return
+        targets = pending
+        failures: List[str] = []
+        TRANSLATION_FAILURES.set(failures)
+        
+        segments, replacements = await asyncio.to_thread(segment_markdown, body, path, targets)
         
-        # Create tasks for all language translations to run in parallel
+        translators = {lang: get_translator(lang) for lang in targets}
+        translations = await translate_segments_async(segments, translators, replacements, admission)
+        # Default metadata for files without front matter, shared by every language
+        metadata = None if front_matter else get_metadata_for_file(path, None)
+        
+        # Create tasks for all language outputs to run in parallel
         tasks = []
-        for lang in targets:
-            task = translate_single_language(path, lang, body, front_matter, semaphore, progress_bar)
+        for lang, output_path in targets.items():
+            translated_body = render_segments(segments, translations[lang], replacements[lang])
+            task = translate_single_language(path, lang, output_path, translated_body, front_matter,
+                                             translators[lang], admission, progress_bar, metadata)
             tasks.append(task)
         
-        # Execute all language translations concurrently
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute all language outputs concurrently
+        written = await asyncio.gather(*tasks, return_exceptions=True)
+        if not failures:
+            for lang, ok in zip(targets, written):
+                if ok is True:
+                    manifest.record(path, lang, source_hash)
+        # One progress update per file rather than one per language
+        progress_bar.update(len(written))
                 
     except Exception as e:
         print(f"Error processing file {path}: {e}")
         progress_bar.update(len(targets))
 
 
-def add_metadata_to_original_files() -> None:
-    """Add metadata to original markdown files before translation."""
-    metadata_config = get_metadata_config()
+def add_metadata_to_original_file(md_file: Path) -> tuple[str | None, str]:
+    """
+    Add metadata to one original markdown file before translation.
     
-    if not metadata_config.get('enabled', False):
-        return
+    Returns:
+        The file's (front_matter, body) split, matching what is on disk
+        afterwards, so the translation pass can skip re-parsing
+    """
+    content = md_file.read_text(encoding="utf-8")
+    front_matter, body = split_front_matter(content)
     
-    for md_file in iter_markdown_files(DOCS_ROOT):
-        content = md_file.read_text(encoding="utf-8")
-        front_matter, body = split_front_matter(content)
-        
-        # Get metadata for this file
-        metadata = get_metadata_for_file(md_file, None)
-        if not metadata or (not metadata.get('title') and not metadata.get('description')):
-            continue
-        
-        # Check if front matter has title or description
-        has_title = front_matter and 'title:' in front_matter if front_matter else False
-        has_description = front_matter and 'description:' in front_matter if front_matter else False
-        
-        # If both exist, skip
-        if has_title and has_description:
-            continue
-        
-        # Add metadata to front matter
-        if front_matter:
-            updated_front_matter = add_metadata_to_front_matter(
-                front_matter, metadata, lang=None, translator=None, file_path=md_file
-            )
-        else:
-            # Create new front matter
-            front_matter_lines = ["---"]
-            if metadata.get('title'):
-                front_matter_lines.append(f"title: {metadata['title']}")
-            if metadata.get('description'):
-                front_matter_lines.append(f"description: {metadata['description']}")
-            front_matter_lines.append("---")
-            updated_front_matter = "\n".join(front_matter_lines)
-        
-        # Write updated content
-        pieces = []
-        if updated_front_matter:
-            pieces.append(updated_front_matter)
-            pieces.append("")
-        pieces.append(body)
-        md_file.write_text("\n".join(pieces).strip() + "\n", encoding="utf-8")
+    # Get metadata for this file
+    metadata = get_metadata_for_file(md_file, None)
+    if not metadata or (not metadata.get('title') and not metadata.get('description')):
+        return front_matter, body
+    
+    # Check if front matter has title or description
+    has_title = front_matter and 'title:' in front_matter if front_matter else False
+    has_description = front_matter and 'description:' in front_matter if front_matter else False
+    
+    # If both exist, skip
+    if has_title and has_description:
+        return front_matter, body
+    
+    # Add metadata to front matter
+    if front_matter:
+        updated_front_matter = add_metadata_to_front_matter(
+            front_matter, metadata, lang=None, translator=None, file_path=md_file
+        )
+    else:
+        # Create new front matter
+        front_matter_lines = ["---"]
+        if metadata.get('title'):
+            front_matter_lines.append(f"title: {metadata['title']}")
+        if metadata.get('description'):
+            front_matter_lines.append(f"description: {metadata['description']}")
+        front_matter_lines.append("---")
+        updated_front_matter = "\n".join(front_matter_lines)
+    
+    # Write updated content
+    updated_content = compose_output(updated_front_matter, body)
+    write_file(md_file, updated_content)
+    return split_front_matter(updated_content)
+
+
+def add_metadata_to_original_files() -> dict[Path, tuple[str | None, str]]:
+    """
+    Add metadata to original markdown files before translation.
+    
+    Returns:
+        Mapping of each visited file to its (front_matter, body) split, matching
+        what is on disk afterwards, so the translation pass can skip re-parsing
+    """
+    if not get_metadata_config().get('enabled', False):
+        return {}
+    return {md_file: add_metadata_to_original_file(md_file) for md_file in iter_markdown_files(DOCS_ROOT)}
+
+
+# Output directories already created by build_translation_path during this run
+CREATED_TRANSLATION_DIRS: set[Path] = set()
 
 
 def build_translation_path(path: Path, suffix: str) -> Path:
@@ -1531,30 +2258,52 @@ def build_translation_path(path: Path, suffix: str) -> Path:
     lang_code = suffix.split('.')[1] if '.' in suffix else suffix
     
     # Get relative path from docs root
-    try:
-        rel_path = path.relative_to(DOCS_ROOT)
-    except ValueError:
+    file_key = get_file_key(path)
+    if file_key is None:
         # If path is not relative to docs root, fall back to old behavior
-        return path.with_name(f"{path.stem}{suffix}")
+        return path.with_name(path.stem + suffix)
     
     # Build new path: docs/lang_code/original_relative_path
-    translated_path = DOCS_ROOT / lang_code / rel_path
+    translated_path = DOCS_ROOT / f"{lang_code}/{file_key}"
     
-    # Create parent directory if it doesn't exist
-    translated_path.parent.mkdir(parents=True, exist_ok=True)
+    # Create parent directory if it doesn't exist (once per directory per run)
+    parent = translated_path.parent
+    if parent not in CREATED_TRANSLATION_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        CREATED_TRANSLATION_DIRS.add(parent)
     
     return translated_path
 
 
+def walk_markdown_files_into_queue(root: Path, queue: asyncio.Queue, loop: asyncio.AbstractEventLoop,
+                                   workers: int) -> None:
+    """
+    Walk markdown files in a worker thread and feed them to an asyncio queue.
+    
+    One None sentinel per worker is queued when the walk finishes (or fails).
+    """
+    try:
+        for path in iter_markdown_files(root):
+            asyncio.run_coroutine_threadsafe(queue.put(path), loop).result()
+    finally:
+        for _ in range(workers):
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+
 def run(targets: Iterable[str]) -> None:
     targets = list(targets)
     if not targets:
         return
     DOCS_ROOT.mkdir(exist_ok=True)
     # Add metadata to original files before translation
-    add_metadata_to_original_files()
-    for md_file in iter_markdown_files(DOCS_ROOT):
-        translate_file(md_file, targets)
+    parsed_files = add_metadata_to_original_files()
+    try:
+        for md_file in iter_markdown_files(DOCS_ROOT):
+            translate_file(md_file, targets, parsed_files.pop(md_file, None))
+    finally:
+        close_translation_cache()
+        save_translation_manifest()
+        HTTP_POOL.close()
 
 
 async def run_async(targets: List[str], args: argparse.Namespace) -> None:
@@ -1564,61 +2313,74 @@ async def run_async(targets: List[str], args: argparse.Namespace) -> None:
     
     DOCS_ROOT.mkdir(exist_ok=True)
     
-    # Add metadata to original files before translation
-    add_metadata_to_original_files()
-    
-    # Collect all markdown files
-    md_files = list(iter_markdown_files(DOCS_ROOT))
-    if not md_files:
-        print("No markdown files found to translate.")
-        return
-    
-    # Calculate total operations (files * languages)
-    total_operations = len(md_files) * len(targets)
+    # Metadata is added to each original file by the worker that translates it
+    add_metadata = get_metadata_config().get('enabled', False)
     
-    print(f"Starting translation of {len(md_files)} files to {len(targets)} languages...")
-    print(f"Total operations: {total_operations}")
+    print(f"Starting translation to {len(targets)} languages...")
     print(f"Using {MAX_CONCURRENT_TRANSLATIONS} concurrent translations with {MAX_CONCURRENT_FILES} concurrent files")
     print(f"Each file will be translated to all languages in parallel for maximum speed")
     
-    # Create semaphores for rate limiting
-    translation_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSLATIONS)
-    file_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILES)
-    
-    # Create progress bar
-    progress_bar = tqdm(total=total_operations, desc="Translating", unit="ops")
+    # Create admission control for rate limiting (adapts to 429 responses)
+    admission = AdmissionController(MAX_CONCURRENT_TRANSLATIONS, min_interval=TRANSLATION_DELAY)
+    
+    # Create progress bar (the total grows as files are discovered)
+    progress_bar = tqdm(total=0, desc="Translating", unit="ops", mininterval=0.5)
+    
+    # Files are streamed from a directory walk in a worker thread, so translation
+    # starts before the walk has finished
+    queue: asyncio.Queue[Path | None] = asyncio.Queue(maxsize=1024)
+    worker_count = max(MAX_CONCURRENT_FILES, 1)
+    file_count = 0
+    
+    # Size the thread pool behind asyncio.to_thread to the work in flight: one
+    # thread per admitted translation, one per file worker (reads, writes,
+    # segmentation) and one for the directory walk. The default pool is sized
+    # by CPU count, which caps concurrent requests on small machines.
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=max(MAX_CONCURRENT_TRANSLATIONS, 1) + worker_count + 1, thread_name_prefix="translate"
+    ))
+    
+    async def worker() -> None:
+        nonlocal file_count
+        while (md_file := await queue.get()) is not None:
+            file_count += 1
+            # No refresh here: the next update() redraws the bar with the new total
+            progress_bar.total += len(targets)
+            # The (front_matter, body) split left by the metadata pass is reused for translation
+            parsed = None
+            if add_metadata:
+                try:
+                    parsed = await asyncio.to_thread(add_metadata_to_original_file, md_file)
+                except Exception as e:
+                    print(f"Error adding metadata to {md_file}: {e}")
+            await translate_file_async(md_file, targets, admission, progress_bar, parsed)
     
     start_time = time.time()
     
     try:
-        # Process files in batches to avoid overwhelming the system
-        batch_size = MAX_CONCURRENT_FILES
-        for i in range(0, len(md_files), batch_size):
-            batch = md_files[i:i + batch_size]
-            
-            # Create tasks for this batch
-            tasks = []
-            for md_file in batch:
-                task = translate_file_async(md_file, targets, translation_semaphore, progress_bar)
-                tasks.append(task)
-            
-            # Wait for this batch to complete
-            await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Small delay between batches
-            if i + batch_size < len(md_files):
-                await asyncio.sleep(0.5)
+        producer = asyncio.to_thread(
+            walk_markdown_files_into_queue, DOCS_ROOT, queue, asyncio.get_running_loop(), worker_count
+        )
+        await asyncio.gather(producer, *(worker() for _ in range(worker_count)))
     
     except Exception as e:
         print(f"Error during translation: {e}")
     
     finally:
         progress_bar.close()
+        close_translation_cache()
+        save_translation_manifest()
+        HTTP_POOL.close()
         
         end_time = time.time()
         duration = end_time - start_time
-        print(f"\nTranslation completed in {duration:.2f} seconds")
-        print(f"Average time per operation: {duration/total_operations:.2f} seconds")
+        total_operations = file_count * len(targets)
+        if total_operations:
+            print(f"\nTranslation completed in {duration:.2f} seconds")
+            print(f"Total operations: {total_operations} ({file_count} files)")
+            print(f"Average time per operation: {duration/total_operations:.2f} seconds")
+        else:
+            print("No markdown files found to translate.")
         
         # Update menu items automatically (unless disabled)
         if not getattr(args, 'no_menu_update', False):
@@ -1662,6 +2424,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Use synchronous processing instead of async (slower but more reliable).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the persistent translation cache.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Translate all files, even those unchanged since the last run.",
+    )
     parser.add_argument(
         "--no-menu-update",
         action="store_true",
@@ -1674,9 +2446,12 @@ def main() -> None:
     args = parse_args()
     
     # Update global constants based on command line arguments
-    global MAX_CONCURRENT_TRANSLATIONS, MAX_CONCURRENT_FILES
+    global MAX_CONCURRENT_TRANSLATIONS, MAX_CONCURRENT_FILES, USE_TRANSLATION_CACHE, FORCE_TRANSLATION
     MAX_CONCURRENT_TRANSLATIONS = args.max_concurrent_translations
     MAX_CONCURRENT_FILES = args.max_concurrent_files
+    USE_TRANSLATION_CACHE = not args.no_cache
+    FORCE_TRANSLATION = args.force
+    use_pooled_http()
     
     with contextlib.ExitStack():
         if args.sync: